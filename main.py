@@ -6,12 +6,19 @@ import asyncio
 import pygame
 import threading
 import os
-import re
 import tempfile
+import time
 import sqlite3
+import hashlib
+import io
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from PIL import Image, ImageTk, ImageEnhance
+from PIL import Image, ImageTk
 
 # --- Constants ---
 DEFAULT_ZOOM = 2.5
@@ -20,10 +27,26 @@ MAX_ZOOM = 4.0
 ZOOM_STEP = 0.25
 PAGES_PER_BATCH = 10
 LOAD_THRESHOLD = 5  # Load more pages when reaching the 5th page of loaded batch
-PAGE_UNLOAD_THRESHOLD = 20  # Unload pages more than this many pages away
+PAGE_CACHE_BUDGET = 512 * 1024 * 1024  # Bytes of rendered pages kept before the farthest from view are evicted
 PAGE_GAP = 10  # Pixels between pages
-SENTENCE_ENDINGS = re.compile(r'(?<=[.!?])\s+')
+SCROLL_DURATION = 0.18  # Seconds for a smooth scroll to settle
 DATA_DIR = Path.home() / ".local" / "pdfest"
+SCHEMA_VERSION = 1  # Bump when adding a books-table migration
+PAGE_CACHE_DIR = DATA_DIR / "pagecache"  # Rendered pages, <doc key>/<zoom>/<page>.ppm (raw, untinted)
+PAGE_CACHE_DISK_LIMIT = 1024 * 1024 * 1024  # Bytes kept on disk, pruned at startup
+PAGE_HANDLE_CACHE = 64  # Parsed fitz.Page objects kept for reuse
+TTS_CACHE_DIR = DATA_DIR / "ttscache"  # Synthesized sentences, <hash of voice + text>.mp3
+TTS_CACHE_DISK_LIMIT = 100 * 1024 * 1024  # Bytes kept on disk, pruned at startup
+THUMB_CACHE_DIR = DATA_DIR / "thumbs"  # Library thumbnails, <hash of path + mtime>.png
+THUMB_CACHE_DISK_LIMIT = 20 * 1024 * 1024  # Bytes kept on disk, pruned at startup
+THUMB_HEIGHT = 80  # Pixels
+LIBRARY_DOC_CACHE = 16  # Documents kept open while the library is shown
+TTS_CONCURRENCY = 3  # Sentences synthesized at once while pre-caching
+PROGRESS_FLUSH_MS = 2000  # Delay before queued reading progress is written to the DB
+DRAG_THROTTLE_MS = 30  # Slider/drag motion is applied at most this often
+SEARCH_DEBOUNCE_MS = 100  # Library search runs once typing pauses this long
+MARGIN_PREVIEW_RGBA = (255, 68, 68, 96)  # Translucent red over excluded header/footer zones
+VOICE_CACHE_TTL = 7 * 24 * 3600  # Seconds the edge-tts voice list is reused before refetching
 DEFAULT_SIDEBAR_WIDTH = 300
 
 
@@ -35,50 +58,86 @@ class LibraryDB:
         self.db_path = DATA_DIR / "library.db"
         self.conn = sqlite3.connect(str(self.db_path))
         self.conn.row_factory = sqlite3.Row
+        self._batch_depth = 0  # > 0 while inside batch(), commits are deferred
+        # Progress updates are written by one background thread on its own connection
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self._writer_conn = None  # Opened and used only on the writer thread
+        self._unwritten = {}  # path -> (seq, progress columns) queued but not yet committed
+        self._write_seq = 0  # Numbers queued writes, so only the newest clears _unwritten
+        self._unwritten_lock = threading.Lock()
         self._init_tables()
     
     def _init_tables(self):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS books (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                path TEXT UNIQUE NOT NULL,
-                title TEXT,
-                total_pages INTEGER DEFAULT 0,
-                last_page INTEGER DEFAULT 0,
-                last_sentence INTEGER DEFAULT 0,
-                zoom_level REAL DEFAULT 2.5,
-                last_opened TEXT,
-                thumbnail_path TEXT
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        ''')
-        # Add zoom_level column if it doesn't exist (migration)
-        try:
-            cursor.execute("ALTER TABLE books ADD COLUMN zoom_level REAL DEFAULT 2.5")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Add margin columns for per-book TTS exclusion (migration)
-        try:
-            cursor.execute("ALTER TABLE books ADD COLUMN header_margin REAL DEFAULT 50")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute("ALTER TABLE books ADD COLUMN footer_margin REAL DEFAULT 60")
-        except sqlite3.OperationalError:
-            pass
-        # Add column_mode for 1-col/2-col reading (migration)
+        # WAL + NORMAL sync: commits no longer fsync the main database file
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-20000")
+        
+        with self.batch():
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS books (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT UNIQUE NOT NULL,
+                    title TEXT,
+                    total_pages INTEGER DEFAULT 0,
+                    last_page INTEGER DEFAULT 0,
+                    last_sentence INTEGER DEFAULT 0,
+                    zoom_level REAL DEFAULT 2.5,
+                    last_opened TEXT,
+                    thumbnail_path TEXT
+                )
+            ''')
+            # Library listing and startup both read books newest-first
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_last_opened ON books(last_opened DESC)")
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
+            
+            # Migrations, skipped entirely once the schema is up to date
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                existing = {row['name'] for row in cursor.execute("PRAGMA table_info(books)")}
+                migrations = [
+                    ("zoom_level", "REAL DEFAULT 2.5"),
+                    # Per-book TTS exclusion margins
+                    ("header_margin", "REAL DEFAULT 50"),
+                    ("footer_margin", "REAL DEFAULT 60"),
+                    # 1-col/2-col reading
+                    ("column_mode", "INTEGER DEFAULT 1"),
+                ]
+                for column, definition in migrations:
+                    if column not in existing:
+                        cursor.execute(f"ALTER TABLE books ADD COLUMN {column} {definition}")
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    @contextmanager
+    def batch(self):
+        """Group several writes into a single transaction (one commit)"""
+        if self._batch_depth == 0:
+            self.conn.execute("BEGIN IMMEDIATE")
+        self._batch_depth += 1
         try:
-            cursor.execute("ALTER TABLE books ADD COLUMN column_mode INTEGER DEFAULT 1")
-        except sqlite3.OperationalError:
-            pass
-        self.conn.commit()
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.rollback()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+    
+    def _commit(self):
+        """Commit unless an enclosing batch() will commit for us"""
+        if self._batch_depth == 0:
+            self.conn.commit()
     
     def get_setting(self, key, default=None):
         cursor = self.conn.cursor()
@@ -92,7 +151,7 @@ class LibraryDB:
             "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
             (key, str(value))
         )
-        self.conn.commit()
+        self._commit()
     
     def add_book(self, path, title=None, total_pages=0):
         if title is None:
@@ -102,64 +161,108 @@ class LibraryDB:
             INSERT OR IGNORE INTO books (path, title, total_pages, last_opened)
             VALUES (?, ?, ?, ?)
         ''', (path, title, total_pages, datetime.now().isoformat()))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
     
     def update_book_progress(self, path, last_page, last_sentence=0, zoom_level=None, header_margin=None, footer_margin=None, column_mode=None):
-        cursor = self.conn.cursor()
-        updates = ["last_page = ?", "last_sentence = ?", "last_opened = ?"]
-        params = [last_page, last_sentence, datetime.now().isoformat()]
-        
-        if zoom_level is not None:
-            updates.append("zoom_level = ?")
-            params.append(zoom_level)
-        if header_margin is not None:
-            updates.append("header_margin = ?")
-            params.append(header_margin)
-        if footer_margin is not None:
-            updates.append("footer_margin = ?")
-            params.append(footer_margin)
-        if column_mode is not None:
-            updates.append("column_mode = ?")
-            params.append(column_mode)
-        
-        params.append(path)
-        cursor.execute(f"UPDATE books SET {', '.join(updates)} WHERE path = ?", params)
-        self.conn.commit()
+        """Queue a progress change for the writer thread; reads see it from memory until it is written"""
+        values = {"last_page": last_page, "last_sentence": last_sentence,
+                  "last_opened": datetime.now().isoformat()}
+        for column, value in (("zoom_level", zoom_level), ("header_margin", header_margin),
+                              ("footer_margin", footer_margin), ("column_mode", column_mode)):
+            if value is not None:
+                values[column] = value
+        
+        with self._unwritten_lock:
+            self._write_seq += 1
+            seq = self._write_seq
+            self._unwritten[path] = (seq, {**self._unwritten.get(path, (0, {}))[1], **values})
+        self.writer.submit(self._write_book_progress, path, values, seq)
+    
+    def _write_book_progress(self, path, values, seq):
+        try:
+            if self._writer_conn is None:
+                self._writer_conn = sqlite3.connect(str(self.db_path))
+            sql = f"UPDATE books SET {', '.join(f'{column} = ?' for column in values)} WHERE path = ?"
+            self._writer_conn.execute(sql, [*values.values(), path])
+            self._writer_conn.commit()
+        except sqlite3.Error as e:
+            print(f"Progress save error: {e}")
+        finally:
+            with self._unwritten_lock:
+                if self._unwritten.get(path, (None,))[0] == seq:  # No newer change queued since
+                    del self._unwritten[path]
+    
+    def _with_unwritten(self, rows, unwritten):
+        """Rows as dicts with queued progress changes applied (read unwritten before the rows)"""
+        return [{**dict(row), **unwritten[row['path']]} if row['path'] in unwritten else row
+                for row in rows]
+    
+    def _unwritten_progress(self):
+        """path -> progress columns queued but not yet committed"""
+        with self._unwritten_lock:
+            return {path: values for path, (seq, values) in self._unwritten.items()}
     
     def get_book(self, path):
+        unwritten = self._unwritten_progress()
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM books WHERE path = ?", (path,))
-        return cursor.fetchone()
+        row = cursor.fetchone()
+        return self._with_unwritten([row], unwritten)[0] if row else row
     
     def get_all_books(self):
+        unwritten = self._unwritten_progress()
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM books ORDER BY last_opened DESC")
-        return cursor.fetchall()
+        cursor.execute(
+            "SELECT id, path, title, total_pages, last_page, last_opened FROM books ORDER BY last_opened DESC"
+        )
+        books = cursor.fetchall()
+        if unwritten:
+            books = self._with_unwritten(books, unwritten)
+            books.sort(key=lambda book: book['last_opened'] or '', reverse=True)
+        return books
     
     def get_last_opened_book(self):
+        # Only read at startup, before any progress is queued
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM books ORDER BY last_opened DESC LIMIT 1")
+        cursor.execute("SELECT path FROM books ORDER BY last_opened DESC LIMIT 1")
         return cursor.fetchone()
     
     def remove_book(self, path):
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM books WHERE path = ?", (path,))
-        self.conn.commit()
+        self._commit()
     
     def close(self):
+        self.writer.submit(self._close_writer)
+        self.writer.shutdown(wait=True)  # Flush queued progress before exiting
         self.conn.close()
+    
+    def _close_writer(self):
+        if self._writer_conn is not None:
+            self._writer_conn.close()
 
 
 class PDFSentence:
     """Struct to hold the text of a sentence and the list of rects (bounding boxes) for highlighting"""
     def __init__(self, text, rects, page_num, y_offset):
         self.text = text
-        self.rects = rects  # List of (x0, y0, x1, y1) tuples in LOCAL page coords
+        self.rects = rects  # One (x0, y0, x1, y1) tuple per text line, in LOCAL page coords
         self.page_num = page_num
         self.y_offset = y_offset  # Global Y offset of the page this sentence is on
 
 
+class RenderedPage:
+    """Struct to hold everything kept in memory for one rendered page"""
+    def __init__(self, photo, offset, height, item):
+        self.photo = photo  # PhotoImage on the canvas (keep reference to prevent GC)
+        self.item = item  # Canvas image item showing the photo
+        self.offset = offset  # Y offset on canvas
+        self.height = height  # Height at current zoom
+        # Tk keeps a 32-bit copy of the image
+        self.nbytes = photo.width() * photo.height() * 4
+
+
 class VisualEdgeReader:
     def __init__(self, root):
         self.root = root
@@ -174,18 +277,31 @@ class VisualEdgeReader:
         # State
         self.doc = None
         self.zoom_level = DEFAULT_ZOOM
-        self.loaded_pages = set()  # Which pages have been rendered
-        self.page_images = {}  # page_num -> PhotoImage (keep references to prevent GC)
-        self.page_pil_images = {}  # page_num -> PIL Image (original without highlight)
-        self.page_offsets = {}  # page_num -> Y offset on canvas
-        self.page_heights = {}  # page_num -> height at current zoom
+        self.pages = {}  # page_num -> RenderedPage
+        self.pages_nbytes = 0  # Sum of RenderedPage.nbytes over self.pages
+        self.loaded_min = self.loaded_max = 0  # Page range in self.pages (valid while non-empty)
+        self.page_words = {}  # page_num -> cached page.get_text("words") (page coords)
+        self.page_rects = {}  # page_num -> page rect at 1x zoom
+        self.page_reading_order = {}  # page_num -> (layout, [(text, line spans) per sentence])
+        self.page_links = {}  # page_num -> clickable link tuples (page coords)
+        self.page_handles = OrderedDict()  # page_num -> fitz.Page, LRU (guarded by doc_lock)
         self.page_width = 0  # Width of pages at current zoom
-        self.sentences = []  # List of PDFSentence objects (global across loaded pages)
+        self.first_page_rect = None  # Unzoomed size of page 0, the basis for page layout
+        self.page_sentences = {}  # page_num -> list of PDFSentence objects in reading order
+        # Memoized (flat sentence list, page_num -> index of its first sentence) behind the
+        # `sentences` property; rebuilt by whichever thread asks first after a change
+        self._sentence_index = None
+        self._sentences_version = 0  # Bumped on every page_sentences change
+        self.sentences_lock = threading.Lock()  # Guards the two above
         self.current_sentence_idx = 0
         self.last_highlighted_page = None  # Track which page has highlight for cleanup
+        self.highlight_items = []  # Canvas rectangles reused for the highlighted lines
+        self.margin_items = {}  # page_num -> (header, footer) margin preview image items
+        self.margin_overlays = {}  # height -> translucent PhotoImage shown by those items
+        self.margin_strip = None  # 1 px high translucent strip, page_width wide, the overlays' source
+        self.stale_pages = set()  # Loaded pages drawn with an old brightness, re-tinted once in view
         self._is_playing = False  # Backing field for property
         self.stop_signal = False
-        self.audio_file = os.path.join(tempfile.gettempdir(), "edge_tts_stream.mp3")
         
         # Load saved voice or use default
         saved_voice = self.db.get_setting("tts_voice", "en-US-AndrewMultilingualNeural")
@@ -194,18 +310,55 @@ class VisualEdgeReader:
         self.total_pages = 0
         self.estimated_page_height = 800  # Will be updated after first page render
         self.canvas_height = 0
+        self.canvas_width = 1  # Kept current by on_canvas_configure (Tk reports 1 until mapped)
         self.loading_lock = threading.Lock()
         self.is_loading = False
         
+        # Background page rendering. MuPDF is not thread-safe, so every call
+        # into it (documents and pixmaps) holds doc_lock. A second worker still
+        # pays off: reading cached pages from disk runs outside the lock.
+        self.render_pool = ThreadPoolExecutor(max_workers=2)
+        # Disk cache writes and pruning, so they never hold up a page render
+        self.cache_pool = ThreadPoolExecutor(max_workers=1)
+        # Library thumbnails get their own worker so they never queue ahead of pages
+        self.thumb_pool = ThreadPoolExecutor(max_workers=1)
+        self.thumb_placeholder = None  # Blank PhotoImage shown until a thumbnail is ready
+        self.library_docs = OrderedDict()  # path -> (mtime, fitz.Document) opened for the library
+        self.library_generation = 0  # Bumped when the library is hidden, to drop queued thumbnails
+        self.doc_lock = threading.RLock()
+        self.pending_pages = set()  # Pages queued in render_pool, not yet on canvas
+        self.render_generation = 0  # Bumped on document/zoom change to drop stale renders
+        self.ready_pages = []  # (page_num, generation, future) awaiting placement on the canvas
+        self.placement_lock = threading.Lock()
+        self.placement_scheduled = False  # A _flush_placements call is queued on the Tk loop
+        self.page_cache_dir = None  # PAGE_CACHE_DIR subfolder for the open document
+        self.cache_pool.submit(self._prune_disk_cache, PAGE_CACHE_DIR, "*.ppm", PAGE_CACHE_DISK_LIMIT)
+        self.cache_pool.submit(self._prune_disk_cache, TTS_CACHE_DIR, "*.mp3", TTS_CACHE_DISK_LIMIT)
+        self.cache_pool.submit(self._prune_disk_cache, THUMB_CACHE_DIR, "*.png", THUMB_CACHE_DISK_LIMIT)
+        for cache_dir in (TTS_CACHE_DIR, PAGE_CACHE_DIR, THUMB_CACHE_DIR):
+            self.cache_pool.submit(self._remove_stale_temp_files, cache_dir, time.time())
+        
         # Audio caching
-        self.audio_cache = {}  # sentence_idx -> audio file path
+        self.audio_cache = OrderedDict()  # sentence_idx -> audio file path, least recently used first
+        self.audio_cache_epoch = 0  # Bumped when cached audio no longer matches the sentences
         self.cache_lock = threading.Lock()
         self.cache_ahead = 5  # Number of sentences to pre-cache ahead
-        self.cache_worker_running = False
+        self.tts_pending = set()  # sentence_idx values currently being synthesized
         self.playback_generation = 0  # Incremented on skip to invalidate stale audio
+        self.playback_wakeup = threading.Event()  # Set on stop/skip to end playback's wait early
+        self.audio_ready = threading.Condition(self.cache_lock)  # Notified when a synthesis finishes
         self.pending_restart = False  # Track if we should restart after skip spam
         self.restart_after_id = None  # ID for scheduled restart
         
+        # All TTS requests run on one long-lived event loop in a background thread
+        self.tts_loop = asyncio.new_event_loop()
+        threading.Thread(target=self.tts_loop.run_forever, daemon=True).start()
+        self.tts_semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+        
+        # Reading progress is queued here and written at most every PROGRESS_FLUSH_MS
+        self.pending_progress = {}  # Extra update_book_progress fields (zoom, margins, ...)
+        self.progress_flush_id = None
+        
         # TOC data
         self.toc = []  # List of (level, title, page_num) tuples
         self.sidebar_visible = True
@@ -217,6 +370,19 @@ class VisualEdgeReader:
         # Sidebar resize state
         self.sidebar_resizing = False
         
+        # Dialogs are built on first use, then hidden and re-shown
+        self.dialogs = {}  # name -> (Toplevel, callback refreshing its contents)
+        
+        # Margin preview redraw queued by the margin sliders
+        self.margin_preview_values = (0, 0)
+        self.margin_preview_id = None
+        
+        # Smooth scroll animation state (canvas y of the viewport top)
+        self._scroll_animating = False
+        self._scroll_start_y = 0
+        self._scroll_target_y = 0
+        self._scroll_t0 = 0.0
+        
         # Text selection state
         self.selection_start = None  # (canvas_x, canvas_y)
         self.selection_end = None
@@ -333,6 +499,8 @@ class VisualEdgeReader:
         self.resize_handle.bind("<Button-1>", self.start_sidebar_resize)
         self.resize_handle.bind("<B1-Motion>", self.do_sidebar_resize)
         self.resize_handle.bind("<ButtonRelease-1>", self.end_sidebar_resize)
+        # Line marking the new sidebar edge while the handle is dragged
+        self.resize_indicator = tk.Frame(self.main_frame, bg="#0078d7")
 
         # Canvas area (Scrollable)
         self.canvas_frame = tk.Frame(self.main_frame, bg="#555")
@@ -392,6 +560,18 @@ class VisualEdgeReader:
             else:
                 self.btn_play.config(text="▶ Play")
 
+    # --- Property for brightness with a precomputed tint ---
+    @property
+    def brightness(self):
+        return self._brightness
+    
+    @brightness.setter
+    def brightness(self, value):
+        self._brightness = value
+        # tint_with scales each channel by level/255; None means no dimming
+        level = int(255 * value)
+        self.brightness_tint = (level << 16) | (level << 8) | level if value < 1.0 else None
+
     def open_pdf(self, filename=None):
         if filename is None:
             filename = filedialog.askopenfilename(filetypes=[("PDF Files", "*.pdf")])
@@ -403,26 +583,40 @@ class VisualEdgeReader:
         
         # Reset state
         self.canvas.delete("all")
-        self.loaded_pages.clear()
-        self.page_images.clear()
-        self.page_pil_images.clear()
-        self.page_offsets.clear()
-        self.page_heights.clear()
-        self.sentences.clear()
-        self.audio_cache.clear()
+        self.highlight_items = []
+        self.last_highlighted_page = None  # Belongs to the previous document
+        self.margin_items.clear()
+        self.pages.clear()
+        self.stale_pages.clear()
+        self.pages_nbytes = 0
+        self.page_words.clear()
+        self.page_rects.clear()
+        self.page_reading_order.clear()
+        self.page_links.clear()
+        self.clear_sentences()
         self.current_sentence_idx = 0
         self.is_playing = False
         self.stop_signal = True
+        self._wake_playback()
+        self.render_generation += 1
+        self.pending_pages.clear()
         
-        self.doc = fitz.open(filename)
+        with self.doc_lock:
+            self.page_handles.clear()
+            self.doc = fitz.open(filename)
         self.total_pages = len(self.doc)
         self.current_pdf_path = filename
         
+        # Rendered pages are cached on disk per file version
+        doc_key = f"{filename}:{os.path.getmtime(filename)}"
+        self.page_cache_dir = PAGE_CACHE_DIR / hashlib.sha1(doc_key.encode()).hexdigest()
+        
         # Add to library database
         self.db.add_book(filename, total_pages=self.total_pages)
         
         # Load TOC
-        self.load_toc()
+        with self.doc_lock:
+            self.load_toc()
         
         # Check for saved zoom level and margins before rendering
         book_info = self.db.get_book(filename)
@@ -443,14 +637,14 @@ class VisualEdgeReader:
             self._update_column_button()
         
         # Estimate total canvas height based on first page
-        first_page = self.doc.load_page(0)
-        rect = first_page.rect
+        with self.doc_lock:
+            self.first_page_rect = rect = self._load_page(0).rect
         self.page_width = int(rect.width * self.zoom_level)
         self.estimated_page_height = int(rect.height * self.zoom_level) + PAGE_GAP
         self.canvas_height = self.total_pages * self.estimated_page_height
         
         # Set scroll region - width will be adjusted for centering
-        self.canvas.config(scrollregion=(0, 0, max(self.page_width, self.canvas.winfo_width()), self.canvas_height))
+        self.canvas.config(scrollregion=(0, 0, max(self.page_width, self.canvas_width), self.canvas_height))
         
         # Load initial batch of pages
         self.render_pages(0, PAGES_PER_BATCH)
@@ -568,20 +762,12 @@ class VisualEdgeReader:
         self._update_column_button()
         
         # Save to database
-        if self.current_pdf_path:
-            self.db.update_book_progress(
-                self.current_pdf_path,
-                self.get_visible_page(),
-                self.current_sentence_idx,
-                column_mode=self.column_mode
-            )
+        self.queue_progress(column_mode=self.column_mode)
         
-        # Re-analyze sentences with new column mode
-        self.sentences.clear()
-        for page_num in self.loaded_pages:
-            page = self.doc.load_page(page_num)
-            y_offset = self.page_offsets.get(page_num, page_num * self.estimated_page_height)
-            self.analyze_page_sentences(page, page_num, y_offset)
+        # Re-analyze sentences with new column mode (words are cached per page)
+        self.clear_sentences()
+        for page_num, page in self.pages.items():
+            self.analyze_page_sentences(page_num, page.offset)
         
         self.current_sentence_idx = 0
     
@@ -602,13 +788,14 @@ class VisualEdgeReader:
         end_page = min(self.total_pages, page_num + PAGES_PER_BATCH)
         
         for p in range(start_page, end_page):
-            if p not in self.loaded_pages:
+            if p not in self.pages:
                 self.render_single_page(p)
         
         # Calculate scroll position
         y_offset = page_num * self.estimated_page_height
         scroll_pos = y_offset / self.canvas_height
         self.canvas.yview_moveto(scroll_pos)
+        self.refresh_stale_pages()
         
         self.update_page_indicator()
 
@@ -620,7 +807,7 @@ class VisualEdgeReader:
         end_page = min(start_page + count, self.total_pages)
         
         for page_num in range(start_page, end_page):
-            if page_num in self.loaded_pages:
+            if page_num in self.pages:
                 continue
             
             self.render_single_page(page_num)
@@ -628,105 +815,310 @@ class VisualEdgeReader:
         self.is_loading = False
 
     def render_single_page(self, page_num):
-        """Render a single page and add it to the canvas"""
-        if page_num in self.loaded_pages:
+        """Queue a page for rasterization; it is drawn on the canvas once ready"""
+        if page_num in self.pages:
+            return
+        if page_num in self.pending_pages:
             return
         
+        self.pending_pages.add(page_num)
+        self._submit_render(page_num, page_num not in self.page_words)
+
+    def _submit_render(self, page_num, need_words):
+        """Rasterize a page on the render pool and hand it to the Tk thread when done"""
+        cache_path = self.page_cache_dir / f"{self.zoom_level:.2f}" / f"{page_num}.ppm"
+        future = self.render_pool.submit(self._rasterize, page_num, self.render_generation,
+                                         self.zoom_level, need_words, cache_path)
+        future.add_done_callback(partial(self._queue_placement, page_num, self.render_generation))
+
+    def _rasterize(self, page_num, generation, zoom, need_words, cache_path):
+        """Worker-pool half of page rendering: all MuPDF work, no Tk calls"""
+        if generation != self.render_generation:
+            return None  # Document or zoom changed while queued
+        
+        # A previously rendered copy is raw PPM: Tk takes it as is, with no decoding
+        cached = None
+        if cache_path.exists():
+            try:
+                cached = cache_path.read_bytes()
+                os.utime(cache_path)  # Keep recently used pages when pruning
+            except OSError as e:
+                print(f"Page cache error for {cache_path}: {e}")
+        
+        tint = self.brightness_tint
+        pix = cache_write = None
+        with self.doc_lock:
+            if generation != self.render_generation:
+                return None
+            
+            page = self._load_page(page_num)
+            if cached is None:
+                mat = fitz.Matrix(zoom, zoom)
+                pix = page.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+                cached = pix.tobytes("ppm")
+                cache_write = (cache_path, cached)  # Untinted
+            if tint is None:
+                ppm = cached
+            else:
+                ppm = self._pixmap_to_ppm(pix if pix is not None else fitz.Pixmap(cached), tint)
+            
+            # Extract words once per page; zoom/column/margin changes reuse them
+            words = page.get_text("words") if need_words else None
+            page_rect = page.rect
+        
+        return ppm, words, page_rect, tint, cache_write
+
+    def _save_cached_page(self, cache_path, data):
+        """Write a rendered page to the disk cache (cache_pool)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)  # Never leave a half-written page behind
+        except OSError as e:
+            print(f"Page cache error for {cache_path}: {e}")
+
+    def _prune_disk_cache(self, cache_dir, pattern, limit):
+        """Delete the least recently used files matching pattern until cache_dir is under limit bytes"""
+        try:
+            entries = []
+            for path in cache_dir.rglob(pattern):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= limit:
+                    break
+                path.unlink()
+                total -= size
+        except OSError as e:
+            print(f"Cache prune error for {cache_dir}: {e}")
+
+    def _remove_stale_temp_files(self, cache_dir, before):
+        """Delete *.tmp files left in cache_dir by writes interrupted before this session started"""
+        try:
+            for path in cache_dir.rglob("*.tmp"):
+                if path.stat().st_mtime < before:  # Newer ones may still be being written
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Cache prune error for {cache_dir}: {e}")
+
+    def _load_page(self, page_num):
+        """Return a parsed page of the open document, reusing recent ones (hold doc_lock)"""
+        page = self.page_handles.get(page_num)
+        if page is not None:
+            self.page_handles.move_to_end(page_num)
+            return page
         page = self.doc.load_page(page_num)
-        mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-        pix = page.get_pixmap(matrix=mat)
+        self.page_handles[page_num] = page
+        if len(self.page_handles) > PAGE_HANDLE_CACHE:
+            self.page_handles.popitem(last=False)
+        return page
+
+    def _queue_placement(self, page_num, generation, future):
+        """Done-callback (worker thread): hand the finished page to the Tk thread"""
+        if future.cancelled():
+            return
+        with self.placement_lock:
+            self.ready_pages.append((page_num, generation, future))
+            if self.placement_scheduled:
+                return  # The pending flush will pick this page up too
+            self.placement_scheduled = True
+        try:
+            self.root.after(0, self._flush_placements)
+        except (RuntimeError, tk.TclError):
+            pass  # Window already closed
+
+    def _flush_placements(self):
+        """Place every page finished since the last flush, then evict once"""
+        with self.placement_lock:
+            ready, self.ready_pages = self.ready_pages, []
+            self.placement_scheduled = False
+        
+        placed = [page_num for page_num, generation, future in ready
+                  if self._place_on_canvas(page_num, generation, future)]
+        self.refresh_stale_pages()
+        if not placed:
+            return
+        self.evict_pages()
+        
+        # A highlight was requested for one of these pages before it was ready
+        if self.is_playing and self.last_highlighted_page in placed:
+            self.draw_highlight()
+
+    def _place_on_canvas(self, page_num, generation, future):
+        """Tk-thread half of page rendering: create the image and draw it; True if placed"""
+        if generation != self.render_generation:
+            return False  # Rendered for a previous document or zoom level
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Render error for page {page_num}: {e}")
+            self.pending_pages.discard(page_num)
+            return False
+        if result is None:
+            self.pending_pages.discard(page_num)
+            return False
+        ppm, words, page_rect, tint, cache_write = result
+        if cache_write is not None:
+            # Written once the page is drawn and Tk is idle, off the render pool
+            self.root.after_idle(self.cache_pool.submit, self._save_cached_page, *cache_write)
+        if words is None and page_num not in self.pages and page_num not in self.page_words:
+            # Re-style of a page evicted meanwhile: it has no words to analyze, and
+            # any full render queued for the page since is still on its way
+            return False
+        self.pending_pages.discard(page_num)
         
         # Calculate Y offset for this page
         y_offset = page_num * self.estimated_page_height
-        self.page_offsets[page_num] = y_offset
-        self.page_heights[page_num] = pix.height
         
-        # Create image and store PIL version for highlighting
-        img_data = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        self.page_pil_images[page_num] = img_data.copy()  # Store original (full brightness)
+        photo = tk.PhotoImage(data=ppm)
+        if tint != self.brightness_tint:
+            self.stale_pages.add(page_num)  # Brightness changed while rendering; redo it
         
-        # Apply brightness filter
-        if self.brightness < 1.0:
-            enhancer = ImageEnhance.Brightness(img_data)
-            img_data = enhancer.enhance(self.brightness)
-        
-        photo = ImageTk.PhotoImage(img_data)
-        self.page_images[page_num] = photo  # Keep reference
+        rendered = self.pages.get(page_num)
+        if rendered is not None:
+            # Re-styled copy of a page already on the canvas (brightness change)
+            rendered.photo = photo
+            self.canvas.itemconfigure(rendered.item, image=photo)
+            return False
         
         # Calculate x offset for centering
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - pix.width) // 2)
+        x_offset = self._x_offset(photo.width())
         
         # Draw on canvas (centered)
-        self.canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW, tags=f"page_{page_num}")
+        item = self.canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW)
+        page = RenderedPage(photo, y_offset, photo.height(), item)
         
-        # Mark as loaded and analyze sentences
-        self.loaded_pages.add(page_num)
-        self.analyze_page_sentences(page, page_num, y_offset)
-
-    def analyze_page_sentences(self, page, page_num, y_offset):
-        """Extracts words and groups them into sentences with coordinates"""
-        words = page.get_text("words")
-        page_height = page.rect.height
-        page_width = page.rect.width
-        
-        # Filter out header/footer words
-        filtered_words = []
-        for w in words:
-            word_y = w[1]
-            if self.header_margin > 0 and word_y < self.header_margin:
-                continue
-            if self.footer_margin > 0 and word_y > (page_height - self.footer_margin):
-                continue
-            filtered_words.append(w)
+        if words is not None:
+            self.page_words[page_num] = words
+            self.page_rects[page_num] = page_rect
         
-        # For 2-column mode, reorder words: left column first, then right column
-        if self.column_mode == 2:
-            midpoint = page_width / 2
-            left_words = [w for w in filtered_words if w[2] < midpoint]  # x1 < midpoint
-            right_words = [w for w in filtered_words if w[0] >= midpoint]  # x0 >= midpoint
-            # Sort each column by Y position (top to bottom), then X
-            left_words.sort(key=lambda w: (w[1], w[0]))
-            right_words.sort(key=lambda w: (w[1], w[0]))
-            # Process left column first, then right
-            filtered_words = left_words + right_words
-        
-        current_text = []
-        current_rects = []
-        
-        for w in filtered_words:
+        # Mark as loaded and analyze sentences
+        self.pages[page_num] = page
+        self.pages_nbytes += page.nbytes
+        if len(self.pages) == 1:
+            self.loaded_min = self.loaded_max = page_num
+        else:
+            self.loaded_min = min(self.loaded_min, page_num)
+            self.loaded_max = max(self.loaded_max, page_num)
+        self.analyze_page_sentences(page_num, y_offset)
+        return True
+
+    def _pixmap_to_ppm(self, pix, tint):
+        """Encode a pixmap as PPM data for Tk, dimmed in place by the brightness tint"""
+        with self.doc_lock:
+            pix.tint_with(0x000000, tint)
+            return pix.tobytes("ppm")
+
+    def analyze_page_sentences(self, page_num, y_offset):
+        """Groups the page's cached words into sentences with coordinates"""
+        zoom = self.zoom_level
+        page_sentences = []
+        for text, spans in self._page_reading_order(page_num):
             # Scale coordinates to match our Zoom level
-            rect = (w[0] * self.zoom_level, w[1] * self.zoom_level, 
-                    w[2] * self.zoom_level, w[3] * self.zoom_level)
-            text = w[4]
-            
-            current_text.append(text)
-            current_rects.append(rect)
-            
-            # Check for sentence ending
-            if re.search(r'[.!?]$', text):
-                full_sentence = " ".join(current_text)
-                self.sentences.append(PDFSentence(full_sentence, current_rects, page_num, y_offset))
-                current_text = []
-                current_rects = []
-
-        # Add any remaining text as a sentence
-        if current_text:
-            self.sentences.append(PDFSentence(" ".join(current_text), current_rects, page_num, y_offset))
-        
-        # Sort sentences by page and position
-        # For 2-column mode, we need to sort by column first (X position), then Y
+            rects = [(x0 * zoom, y0 * zoom, x1 * zoom, y1 * zoom) for x0, y0, x1, y1 in spans]
+            page_sentences.append(PDFSentence(text, rects, page_num, y_offset))
+        
+        self.page_sentences[page_num] = page_sentences
+        self._invalidate_sentences()
+
+    def _page_reading_order(self, page_num):
+        """(text, line spans) per sentence for the current layout, cached until margins/columns change"""
+        layout = (self.column_mode, self.header_margin, self.footer_margin)
+        cached = self.page_reading_order.get(page_num)
+        if cached is not None and cached[0] == layout:
+            return cached[1]
+        
+        words = self.page_words[page_num]
+        page_rect = self.page_rects[page_num]
+        
+        # Header/footer exclusion bounds (a margin of 0 disables that side)
+        top = self.header_margin if self.header_margin > 0 else float("-inf")
+        bottom = page_rect.height - self.footer_margin if self.footer_margin > 0 else float("inf")
+        
         if self.column_mode == 2:
-            page_width = page.rect.width * self.zoom_level
-            midpoint = page_width / 2
-            # Sort by: page, column (left=0, right=1), then Y position
-            self.sentences.sort(key=lambda s: (
-                s.page_num,
-                0 if (s.rects and s.rects[0][0] < midpoint) else 1,  # left=0, right=1
-                s.rects[0][1] if s.rects else 0  # Y position within column
-            ))
+            # Filter and assign columns in one pass; words straddling the
+            # midpoint belong to neither column
+            midpoint = page_rect.width / 2
+            filtered_words = [w for w in words
+                              if top <= w[1] <= bottom and (w[2] < midpoint or w[0] >= midpoint)]
+            # Single sort: left column first, then top to bottom, then X
+            filtered_words.sort(key=lambda w: (w[0] >= midpoint, w[1], w[0]))
         else:
-            self.sentences.sort(key=lambda s: (s.page_num, s.rects[0][1] if s.rects else 0))
+            filtered_words = [w for w in words if top <= w[1] <= bottom]
+        
+        # Cut points: each sentence ends just after a word with a sentence ending
+        n = len(filtered_words)
+        ends = [i + 1 for i, w in enumerate(filtered_words) if w[4].endswith(('.', '!', '?'))]
+        if n and (not ends or ends[-1] < n):
+            ends.append(n)  # Remaining text forms a final sentence
+        
+        chunks = [filtered_words[start:end] for start, end in zip([0] + ends, ends)]
+        if self.column_mode != 2:
+            # MuPDF extraction order isn't top to bottom; read sentences by their
+            # first word's y (stable, so sentences starting on one line keep their order)
+            chunks.sort(key=lambda chunk: chunk[0][1])
+        order = [(" ".join([w[4] for w in chunk]), self._line_spans(chunk)) for chunk in chunks]
+        
+        self.page_reading_order[page_num] = (layout, order)
+        return order
+
+    def _line_spans(self, words):
+        """Merge a sentence's word boxes into one (x0, y0, x1, y1) span per text line"""
+        if len(words) == 1:
+            return [words[0][:4]]
+        spans = {}
+        for x0, y0, x1, y1, *_ in words:
+            key = int(y0) // 5  # Same line if the tops fall in the same 5pt band
+            span = spans.get(key)
+            if span is None:
+                spans[key] = [x0, y0, x1, y1]
+            else:
+                span[0] = min(span[0], x0)
+                span[1] = min(span[1], y0)
+                span[2] = max(span[2], x1)
+                span[3] = max(span[3], y1)
+        return [tuple(span) for span in spans.values()]
+
+    @property
+    def sentences(self):
+        """All analyzed sentences in reading order, flattened from page_sentences"""
+        return self._get_sentence_index()[0]
+
+    def _get_sentence_index(self):
+        """(flat sentences, page_num -> first sentence index), rebuilt if page_sentences changed"""
+        with self.sentences_lock:
+            if self._sentence_index is not None:
+                return self._sentence_index
+            version = self._sentences_version
+        
+        # Build outside the lock into locals, so the Tk thread never waits on it
+        flat = []
+        starts = {}
+        for page_num, page in sorted(self.page_sentences.items()):
+            if page:
+                starts[page_num] = len(flat)
+                flat.extend(page)
+        index = (flat, starts)
+        
+        with self.sentences_lock:
+            if self._sentences_version == version:  # Else page_sentences changed meanwhile
+                self._sentence_index = index
+        return index
+
+    def _invalidate_sentences(self):
+        """Drop the memoized sentence list after page_sentences changed (Tk thread)"""
+        with self.sentences_lock:
+            self._sentences_version += 1
+            self._sentence_index = None
+
+    def clear_sentences(self):
+        """Drop all analyzed sentences (and the audio keyed by their indices)"""
+        self.page_sentences.clear()
+        self._invalidate_sentences()
+        self.clear_audio_cache()
 
     def get_visible_page(self):
         """Determine which page is currently most visible"""
@@ -738,14 +1130,11 @@ class VisualEdgeReader:
         canvas_height = self.canvas.winfo_height()
         scroll_center = scroll_top + canvas_height / 2
         
-        # Find which page contains the center of the viewport
-        for page_num in range(self.total_pages):
-            page_top = page_num * self.estimated_page_height
-            page_bottom = page_top + self.estimated_page_height
-            if page_top <= scroll_center < page_bottom:
-                return page_num
-        
-        return 0
+        # Every page occupies one estimated_page_height slot, so divide directly
+        if self.estimated_page_height <= 0 or scroll_center < 0:
+            return 0
+        page_num = int(scroll_center // self.estimated_page_height)
+        return page_num if page_num < self.total_pages else 0
 
     def check_and_load_more_pages(self):
         """Check if we need to load more pages based on scroll position"""
@@ -755,8 +1144,10 @@ class VisualEdgeReader:
         visible_page = self.get_visible_page()
         
         # Find loaded page range
-        min_loaded = min(self.loaded_pages) if self.loaded_pages else self.total_pages
-        max_loaded = max(self.loaded_pages) if self.loaded_pages else -1
+        if self.pages:
+            min_loaded, max_loaded = self.loaded_min, self.loaded_max
+        else:
+            min_loaded, max_loaded = self.total_pages, -1
         
         pages_to_load = []
         
@@ -764,14 +1155,14 @@ class VisualEdgeReader:
         if visible_page >= max_loaded - LOAD_THRESHOLD + 1:
             next_start = max_loaded + 1
             for p in range(next_start, min(next_start + PAGES_PER_BATCH, self.total_pages)):
-                if p not in self.loaded_pages:
+                if p not in self.pages:
                     pages_to_load.append(p)
         
         # Check if we need to load pages behind
         if visible_page <= min_loaded + LOAD_THRESHOLD - 1:
             prev_end = min_loaded
             for p in range(max(0, prev_end - PAGES_PER_BATCH), prev_end):
-                if p not in self.loaded_pages:
+                if p not in self.pages:
                     pages_to_load.append(p)
         
         if pages_to_load:
@@ -783,40 +1174,49 @@ class VisualEdgeReader:
     def _load_pages_list(self, pages):
         """Load a specific list of pages"""
         for page_num in pages:
-            if page_num not in self.loaded_pages:
+            if page_num not in self.pages:
                 self.render_single_page(page_num)
         self.is_loading = False
-        
-        # Unload distant pages to save memory
-        self.unload_distant_pages()
     
-    def unload_distant_pages(self):
-        """Unload pages that are far from the current view to save memory"""
-        if not self.doc or not self.loaded_pages:
+    def evict_pages(self):
+        """Unload the pages farthest from the view until the cache fits PAGE_CACHE_BUDGET"""
+        if self.pages_nbytes <= PAGE_CACHE_BUDGET:
             return
         
+        # Trim from the ends of the loaded block inward, so the pages kept stay one
+        # unbroken run around the view (loading only ever extends that run's edges)
         visible_page = self.get_visible_page()
-        pages_to_unload = []
-        
-        for page_num in list(self.loaded_pages):
-            distance = abs(page_num - visible_page)
-            if distance > PAGE_UNLOAD_THRESHOLD:
-                pages_to_unload.append(page_num)
-        
-        for page_num in pages_to_unload:
-            # Remove from canvas
-            self.canvas.delete(f"page_{page_num}")
-            # Remove from tracking
-            self.loaded_pages.discard(page_num)
-            # Free memory
-            if page_num in self.page_images:
-                del self.page_images[page_num]
-            if page_num in self.page_pil_images:
-                del self.page_pil_images[page_num]
-            if page_num in self.page_offsets:
-                del self.page_offsets[page_num]
-            if page_num in self.page_heights:
-                del self.page_heights[page_num]
+        excess = self.pages_nbytes - PAGE_CACHE_BUDGET
+        victims = []
+        for page_num in sorted(self.pages, key=lambda pn: abs(pn - visible_page), reverse=True):
+            if excess <= 0:
+                break
+            # Never evict what is (or is about to be) on screen
+            if abs(page_num - visible_page) <= 1:
+                break
+            victims.append(page_num)
+            excess -= self.pages[page_num].nbytes
+        
+        for page_num in victims:
+            self.unload_page(page_num)
+        # Refresh the loaded range once, and only if a bound was evicted
+        if self.pages and (self.loaded_min in victims or self.loaded_max in victims):
+            self.loaded_min = min(self.pages)
+            self.loaded_max = max(self.pages)
+    
+    def unload_page(self, page_num):
+        """Remove a rendered page from the canvas and free its memory (caller fixes loaded_min/max)"""
+        page = self.pages.pop(page_num)
+        self.canvas.delete(page.item)
+        self.stale_pages.discard(page_num)
+        self.pages_nbytes -= page.nbytes
+        if page_num in self.page_words:
+            del self.page_words[page_num]
+            del self.page_rects[page_num]
+        if page_num in self.page_reading_order:
+            del self.page_reading_order[page_num]
+        if page_num in self.page_links:
+            del self.page_links[page_num]
 
     def update_page_indicator(self):
         """Update the page entry and total pages label based on visible page"""
@@ -836,6 +1236,30 @@ class VisualEdgeReader:
         """Handle scroll events"""
         self.update_page_indicator()
         self.check_and_load_more_pages()
+        self.refresh_stale_pages()
+        if self.margin_items:
+            self.queue_margin_preview(*self.margin_preview_values)  # Cover newly visible pages
+        self.queue_progress()
+    
+    def _viewport(self):
+        """Canvas y range currently on screen"""
+        top = self.canvas.canvasy(0)
+        return top, top + self.canvas.winfo_height()
+    
+    def _visible_pages(self):
+        """Loaded pages overlapping the viewport"""
+        top, bottom = self._viewport()
+        return [page_num for page_num, page in self.pages.items()
+                if page.offset + page.height > top and page.offset < bottom]
+    
+    def refresh_stale_pages(self):
+        """Re-render stale pages that have scrolled into view"""
+        if not self.stale_pages:
+            return
+        for page_num in self._visible_pages():
+            if page_num in self.stale_pages:
+                self.stale_pages.discard(page_num)
+                self._submit_render(page_num, False)
     
     def scroll_down(self):
         """Scroll down - for keyboard shortcut"""
@@ -863,48 +1287,40 @@ class VisualEdgeReader:
         # Start smooth scroll animation
         self.smooth_scroll(delta)
     
-    def smooth_scroll(self, total_delta, steps=8):
-        """Animate scroll over multiple frames for smoothness"""
-        if not hasattr(self, '_scroll_queue'):
-            self._scroll_queue = 0
-            self._scroll_animating = False
+    def smooth_scroll(self, total_delta):
+        """Ease the view toward a target offset; new deltas extend the running animation"""
+        if self.canvas_height <= 0:
+            return
+        current_y = self.canvas.yview()[0] * self.canvas_height
+        base_y = self._scroll_target_y if self._scroll_animating else current_y
+        max_y = max(0, self.canvas_height - self.canvas.winfo_height())
         
-        self._scroll_queue += total_delta
+        # Re-base the easing at the current position so extending never jumps
+        self._scroll_start_y = current_y
+        self._scroll_target_y = max(0, min(max_y, base_y + total_delta))
+        self._scroll_t0 = time.perf_counter()
         
         if not self._scroll_animating:
             self._scroll_animating = True
-            self._animate_scroll(steps)
+            self._animate_scroll()
     
-    def _animate_scroll(self, steps_remaining):
-        """Execute one frame of scroll animation"""
-        if not hasattr(self, '_scroll_queue') or abs(self._scroll_queue) < 1:
-            self._scroll_animating = False
-            self._scroll_queue = 0
-            self.on_scroll()
-            return
-        
-        # Calculate step size with easing
-        step = self._scroll_queue / max(steps_remaining, 3)
-        
-        # Apply scroll
-        current_pos = self.canvas.yview()[0]
-        scroll_fraction = step / self.canvas_height if self.canvas_height > 0 else 0
-        new_pos = max(0, min(1, current_pos + scroll_fraction))
-        self.canvas.yview_moveto(new_pos)
-        
-        self._scroll_queue -= step
-        
-        # Continue animation
-        if abs(self._scroll_queue) > 0.5:
-            self.root.after(12, lambda: self._animate_scroll(steps_remaining - 1))  # ~83fps
+    def _animate_scroll(self):
+        """Execute one frame of scroll animation (ease-out cubic over elapsed time)"""
+        t = min(1.0, (time.perf_counter() - self._scroll_t0) / SCROLL_DURATION)
+        eased = 1 - (1 - t) ** 3
+        y = self._scroll_start_y + eased * (self._scroll_target_y - self._scroll_start_y)
+        self.canvas.yview_moveto(y / self.canvas_height)
+        
+        if t < 1.0:
+            self.root.after(12, self._animate_scroll)  # ~83fps
         else:
             self._scroll_animating = False
-            self._scroll_queue = 0
             self.on_scroll()
 
     def on_canvas_configure(self, event):
         """Handle canvas resize - re-center pages"""
-        if self.doc and self.loaded_pages:
+        self.canvas_width = event.width
+        if self.doc and self.pages:
             # Save scroll position
             scroll_pos = self.canvas.yview()[0]
             
@@ -915,18 +1331,20 @@ class VisualEdgeReader:
             self.canvas.yview_moveto(scroll_pos)
         self.on_scroll()
     
+    def _x_offset(self, width):
+        """Left edge that centers something `width` pixels wide on the canvas"""
+        return max(0, (self.canvas_width - width) // 2)
+
     def reposition_pages(self):
         """Reposition all loaded pages to center them"""
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - self.page_width) // 2)
+        x_offset = self._x_offset(self.page_width)
+        
+        for page in self.pages.values():
+            self.canvas.coords(page.item, x_offset, page.offset)
         
-        for page_num in self.loaded_pages:
-            y_offset = self.page_offsets.get(page_num, page_num * self.estimated_page_height)
-            # Delete and recreate the page image at new position
-            self.canvas.delete(f"page_{page_num}")
-            if page_num in self.page_images:
-                self.canvas.create_image(x_offset, y_offset, image=self.page_images[page_num], 
-                                        anchor=tk.NW, tags=f"page_{page_num}")
+        # Follow the pages with the highlight
+        if self.last_highlighted_page is not None:
+            self._draw_highlight_rects()
 
     # --- Text selection ---
     def on_selection_start(self, event):
@@ -994,13 +1412,12 @@ class VisualEdgeReader:
             return
         
         # Calculate x offset for centering
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - self.page_width) // 2)
+        x_offset = self._x_offset(self.page_width)
         
         # Find which page was clicked
-        for page_num in self.loaded_pages:
-            page_y_offset = self.page_offsets.get(page_num, 0)
-            page_height = self.page_heights.get(page_num, self.estimated_page_height)
+        for page_num, page in self.pages.items():
+            page_y_offset = page.offset
+            page_height = page.height
             
             if canvas_y < page_y_offset or canvas_y > page_y_offset + page_height:
                 continue
@@ -1009,27 +1426,35 @@ class VisualEdgeReader:
             page_x = (canvas_x - x_offset) / self.zoom_level
             page_y = (canvas_y - page_y_offset) / self.zoom_level
             
-            # Get links on this page
-            page = self.doc.load_page(page_num)
-            links = page.get_links()
-            
-            for link in links:
-                rect = link.get("from")
-                if rect and rect.x0 <= page_x <= rect.x1 and rect.y0 <= page_y <= rect.y1:
+            for x0, y0, x1, y1, uri, dest_page in self._page_links(page_num):
+                if x0 <= page_x <= x1 and y0 <= page_y <= y1:
                     # Found a link!
-                    uri = link.get("uri")
                     if uri:
                         import webbrowser
                         webbrowser.open(uri)
-                        return
-                    
-                    # Internal link (page jump)
-                    dest_page = link.get("page")
-                    if dest_page is not None and dest_page >= 0:
+                    else:
+                        # Internal link (page jump)
                         self.scroll_to_page(dest_page)
-                        return
+                    return
             break  # Only check the clicked page
     
+    def _page_links(self, page_num):
+        """Clickable links on a page as (x0, y0, x1, y1, uri, dest_page) in page coords, cached"""
+        links = self.page_links.get(page_num)
+        if links is None:
+            with self.doc_lock:
+                raw = self._load_page(page_num).get_links()
+            links = []
+            for link in raw:
+                rect = link.get("from")
+                uri = link.get("uri")
+                dest_page = link.get("page")
+                # Links that neither open a URI nor jump to a page do nothing on click
+                if rect and (uri or (dest_page is not None and dest_page >= 0)):
+                    links.append((rect.x0, rect.y0, rect.x1, rect.y1, uri, dest_page))
+            self.page_links[page_num] = links
+        return links
+    
     def extract_and_highlight_selection(self):
         """Extract text from selection area and draw highlights"""
         if not self.doc or self.selection_start is None or self.selection_end is None:
@@ -1045,16 +1470,16 @@ class VisualEdgeReader:
         sel_bottom = max(y0, y1)
         
         # Calculate x offset for centering
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - self.page_width) // 2)
+        x_offset = self._x_offset(self.page_width)
+        zoom = self.zoom_level
         
         selected_texts = []
         self.canvas.delete("selection")
         
         # Find pages that intersect with selection
-        for page_num in self.loaded_pages:
-            page_y_offset = self.page_offsets.get(page_num, 0)
-            page_height = self.page_heights.get(page_num, self.estimated_page_height)
+        for page_num, page in self.pages.items():
+            page_y_offset = page.offset
+            page_height = page.height
             
             page_top = page_y_offset
             page_bottom = page_y_offset + page_height
@@ -1064,35 +1489,34 @@ class VisualEdgeReader:
                 continue
             
             # Convert canvas coords to page coords
-            page_sel_left = (sel_left - x_offset) / self.zoom_level
-            page_sel_right = (sel_right - x_offset) / self.zoom_level
-            page_sel_top = (sel_top - page_y_offset) / self.zoom_level
-            page_sel_bottom = (sel_bottom - page_y_offset) / self.zoom_level
+            page_sel_left = (sel_left - x_offset) / zoom
+            page_sel_right = (sel_right - x_offset) / zoom
+            page_sel_top = (sel_top - page_y_offset) / zoom
+            page_sel_bottom = (sel_bottom - page_y_offset) / zoom
             
-            # Get text from this page in the selection area
-            page = self.doc.load_page(page_num)
-            rect = fitz.Rect(page_sel_left, page_sel_top, page_sel_right, page_sel_bottom)
-            
-            # Get text blocks in selection
-            text = page.get_text("text", clip=rect)
-            if text.strip():
-                selected_texts.append(text)
+            # Collect the cached words touching the selection, merged into one span per text line
+            lines = {}
+            for wx0, wy0, wx1, wy1, text, block_no, line_no, _ in self.page_words.get(page_num, ()):
+                if wx1 < page_sel_left or wx0 > page_sel_right or wy1 < page_sel_top or wy0 > page_sel_bottom:
+                    continue
+                key = (block_no, line_no)
+                line = lines.get(key)
+                if line is None:
+                    lines[key] = [wx0, wy0, wx1, wy1, [text]]
+                else:
+                    line[0] = min(line[0], wx0)
+                    line[1] = min(line[1], wy0)
+                    line[2] = max(line[2], wx1)
+                    line[3] = max(line[3], wy1)
+                    line[4].append(text)
+            if lines:
+                selected_texts.append("\n".join(" ".join(line[4]) for line in lines.values()))
             
-            # Get word rectangles for highlighting
-            words = page.get_text("words", clip=rect)
-            for word in words:
-                # word is (x0, y0, x1, y1, "word", block_no, line_no, word_no)
-                wx0, wy0, wx1, wy1 = word[:4]
-                
-                # Convert back to canvas coords
-                canvas_wx0 = x_offset + wx0 * self.zoom_level
-                canvas_wy0 = page_y_offset + wy0 * self.zoom_level
-                canvas_wx1 = x_offset + wx1 * self.zoom_level
-                canvas_wy1 = page_y_offset + wy1 * self.zoom_level
-                
-                # Draw blue highlight
+            # Draw one blue highlight per line, converted back to canvas coords
+            for lx0, ly0, lx1, ly1, _ in lines.values():
                 self.canvas.create_rectangle(
-                    canvas_wx0, canvas_wy0, canvas_wx1, canvas_wy1,
+                    x_offset + lx0 * zoom, page_y_offset + ly0 * zoom,
+                    x_offset + lx1 * zoom, page_y_offset + ly1 * zoom,
                     fill="#4488ff", stipple="gray50", outline="",
                     tags="selection"
                 )
@@ -1129,24 +1553,26 @@ class VisualEdgeReader:
         self.zoom_level = new_zoom
         self.lbl_zoom.config(text=f"{int(self.zoom_level * 100)}%")
         
-        # Recalculate page dimensions
-        first_page = self.doc.load_page(0)
-        rect = first_page.rect
+        # Recalculate page dimensions (no MuPDF call, which could wait on a render)
+        rect = self.first_page_rect
         self.page_width = int(rect.width * self.zoom_level)
         self.estimated_page_height = int(rect.height * self.zoom_level) + PAGE_GAP
         self.canvas_height = self.total_pages * self.estimated_page_height
         
         # Clear and re-render
         self.canvas.delete("all")
-        old_loaded = list(self.loaded_pages)
-        self.loaded_pages.clear()
-        self.page_images.clear()
-        self.page_offsets.clear()
-        self.page_heights.clear()
-        self.sentences.clear()
+        self.highlight_items = []
+        self.margin_items.clear()
+        self.render_generation += 1
+        old_loaded = list(self.pages.keys() | self.pending_pages)
+        self.pending_pages.clear()
+        self.pages.clear()
+        self.stale_pages.clear()
+        self.pages_nbytes = 0
+        self.clear_sentences()
         
         # Update scroll region
-        self.canvas.config(scrollregion=(0, 0, max(self.page_width, self.canvas.winfo_width()), self.canvas_height))
+        self.canvas.config(scrollregion=(0, 0, max(self.page_width, self.canvas_width), self.canvas_height))
         
         # Re-render previously loaded pages
         for page_num in old_loaded:
@@ -1175,10 +1601,9 @@ class VisualEdgeReader:
         self.last_highlighted_page = page_num
         
         # Make sure the page is loaded
-        if page_num not in self.loaded_pages:
-            self.render_single_page(page_num)
-        
-        y_offset = self.page_offsets.get(page_num, 0)
+        self.render_single_page(page_num)
+        page = self.pages.get(page_num)
+        y_offset = page.offset if page else page_num * self.estimated_page_height
         
         # Auto-scroll only if the highlight is below 3/4 of the visible area
         if sentence.rects:
@@ -1198,79 +1623,41 @@ class VisualEdgeReader:
                 target_scroll = global_y - (canvas_visible_height * 0.2)
                 scroll_pos = max(0, target_scroll / self.canvas_height)
                 self.canvas.yview_moveto(scroll_pos)
+                self.refresh_stale_pages()
 
-        # Get the original page image
-        if page_num not in self.page_pil_images:
+        self._draw_highlight_rects()
+    
+    def _draw_highlight_rects(self):
+        """(Re)draw the current sentence as stippled rectangles over its page image"""
+        if not self.sentences or self.current_sentence_idx >= len(self.sentences):
+            self.clear_highlight(self.last_highlighted_page)
+            return
+        sentence = self.sentences[self.current_sentence_idx]
+        page = self.pages.get(sentence.page_num)
+        if page is None:
+            self.clear_highlight(sentence.page_num)
             return
         
-        # Create a copy of the original image to draw on
-        img = self.page_pil_images[page_num].copy().convert("RGBA")
-        
-        # Create highlight overlay
-        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        from PIL import ImageDraw
-        draw = ImageDraw.Draw(overlay)
-        
-        # Group rects by their Y position (same line)
-        lines = {}
-        for r in sentence.rects:
-            line_key = round(r[1] / 5) * 5
-            if line_key not in lines:
-                lines[line_key] = {'x0': r[0], 'y0': r[1], 'x1': r[2], 'y1': r[3]}
+        # Move a see-through yellow box onto each line, reusing existing items
+        lines = sentence.rects
+        x_offset = self._x_offset(self.page_width)
+        for i, (x0, y0, x1, y1) in enumerate(lines):
+            coords = (x_offset + x0 - 2, page.offset + y0 - 2,
+                      x_offset + x1 + 2, page.offset + y1 + 2)
+            if i < len(self.highlight_items):
+                item = self.highlight_items[i]
+                self.canvas.coords(item, *coords)
+                self.canvas.itemconfigure(item, state=tk.NORMAL)
             else:
-                lines[line_key]['x0'] = min(lines[line_key]['x0'], r[0])
-                lines[line_key]['x1'] = max(lines[line_key]['x1'], r[2])
-                lines[line_key]['y0'] = min(lines[line_key]['y0'], r[1])
-                lines[line_key]['y1'] = max(lines[line_key]['y1'], r[3])
-        
-        # Draw semi-transparent yellow highlight for each line
-        for line in lines.values():
-            x0 = int(line['x0'] - 2)
-            y0 = int(line['y0'] - 2)
-            x1 = int(line['x1'] + 2)
-            y1 = int(line['y1'] + 2)
-            # Yellow with 40% opacity (102 out of 255)
-            draw.rectangle([x0, y0, x1, y1], fill=(255, 255, 0, 102))
-        
-        # Composite the overlay onto the image
-        highlighted_img = Image.alpha_composite(img, overlay).convert("RGB")
-        
-        # Apply brightness filter
-        if self.brightness < 1.0:
-            enhancer = ImageEnhance.Brightness(highlighted_img)
-            highlighted_img = enhancer.enhance(self.brightness)
-        
-        # Update the page image on canvas
-        photo = ImageTk.PhotoImage(highlighted_img)
-        self.page_images[page_num] = photo  # Keep reference
-        
-        # Update canvas
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - self.page_width) // 2)
-        self.canvas.delete(f"page_{page_num}")
-        self.canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW, tags=f"page_{page_num}")
+                self.highlight_items.append(self.canvas.create_rectangle(
+                    *coords, fill="#ffff00", stipple="gray50", outline="", tags="highlight"))
+        for item in self.highlight_items[len(lines):]:
+            self.canvas.itemconfigure(item, state=tk.HIDDEN)
+        self.canvas.tag_raise("highlight")
     
     def clear_highlight(self, page_num):
-        """Restore original page image without highlight"""
-        if page_num not in self.page_pil_images:
-            return
-        
-        img = self.page_pil_images[page_num].copy()
-        
-        # Apply brightness filter
-        if self.brightness < 1.0:
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(self.brightness)
-        
-        photo = ImageTk.PhotoImage(img)
-        self.page_images[page_num] = photo
-        
-        y_offset = self.page_offsets.get(page_num, 0)
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - self.page_width) // 2)
-        
-        self.canvas.delete(f"page_{page_num}")
-        self.canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW, tags=f"page_{page_num}")
+        """Hide the highlight overlay (its items are kept for reuse)"""
+        self.canvas.itemconfigure("highlight", state=tk.HIDDEN)
 
     # --- Audio Logic ---
     def toggle_play(self):
@@ -1278,6 +1665,7 @@ class VisualEdgeReader:
             self.stop_signal = True
             self.is_playing = False
             pygame.mixer.music.stop()  # Stop audio immediately
+            self._wake_playback()
         else:
             # Reset index if out of bounds
             if self.current_sentence_idx >= len(self.sentences):
@@ -1299,87 +1687,125 @@ class VisualEdgeReader:
     
     def find_first_sentence_on_page(self, page_num):
         """Find the index of the first sentence on the given page"""
-        for i, sentence in enumerate(self.sentences):
-            if sentence.page_num == page_num:
-                return i
-        return None
+        return self._get_sentence_index()[1].get(page_num)
 
     async def generate_audio(self, text, output_file):
         communicate = edge_tts.Communicate(text, self.voice)
         await communicate.save(output_file)
 
-    def run_async_generation(self, text, output_file):
-        asyncio.run(self.generate_audio(text, output_file))
+    async def stream_audio(self, text, generation):
+        """Collect streamed MP3 chunks in memory; None if playback moved on meanwhile"""
+        buf = io.BytesIO()
+        async for chunk in edge_tts.Communicate(text, self.voice).stream():
+            if self.stop_signal or self.playback_generation != generation:
+                return None  # Abandon the request instead of draining it
+            if chunk["type"] == "audio":
+                buf.write(chunk["data"])
+        buf.seek(0)
+        return buf
     
     def get_cache_file(self, sentence_idx):
-        """Get the cache file path for a sentence"""
-        return os.path.join(tempfile.gettempdir(), f"edge_tts_cache_{sentence_idx}.mp3")
+        """Get the on-disk cache path for a sentence, keyed by voice and text"""
+        key = f"{self.voice}\n{self.sentences[sentence_idx].text}"
+        return str(TTS_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.mp3")
     
-    def cache_sentence(self, sentence_idx):
-        """Generate and cache audio for a specific sentence"""
-        if sentence_idx >= len(self.sentences):
-            return False
-        
-        with self.cache_lock:
-            if sentence_idx in self.audio_cache:
-                return True  # Already cached
-        
-        sentence = self.sentences[sentence_idx]
-        cache_file = self.get_cache_file(sentence_idx)
-        
+    def _touch_cached_audio(self, cache_file):
+        """True if cache_file exists; marks it recently used for pruning"""
         try:
-            self.run_async_generation(sentence.text, cache_file)
-            with self.cache_lock:
-                self.audio_cache[sentence_idx] = cache_file
+            os.utime(cache_file)
             return True
-        except Exception as e:
-            print(f"Cache error for sentence {sentence_idx}: {e}")
+        except OSError:
             return False
     
-    def start_cache_worker(self, start_idx):
-        """Start background worker to cache upcoming sentences"""
-        if self.cache_worker_running:
-            return
-        self.cache_worker_running = True
-        threading.Thread(target=self._cache_worker, daemon=True).start()
+    def _temp_audio_file(self):
+        """Create a scratch file next to the cache, so finished audio can be os.replace()d in"""
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=TTS_CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        return path
     
-    def _cache_worker(self):
-        """Background worker that continuously caches upcoming sentences while playing"""
+    def _save_audio(self, cache_file, data):
+        """Write streamed audio to the disk cache (never leaves a half-written file)"""
+        tmp_path = None
         try:
-            while self.is_playing and not self.stop_signal:
-                # Cache next 5 sentences from current position
-                current = self.current_sentence_idx
-                for i in range(current, min(current + self.cache_ahead, len(self.sentences))):
-                    if self.stop_signal or not self.is_playing:
-                        break
-                    # Skip if already cached
-                    with self.cache_lock:
-                        if i in self.audio_cache:
-                            continue
-                    self.cache_sentence(i)
-                
-                # Small sleep to avoid busy loop
-                if self.is_playing and not self.stop_signal:
-                    import time
-                    time.sleep(0.1)
-        finally:
-            self.cache_worker_running = False
+            tmp_path = self._temp_audio_file()
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            print(f"TTS cache error for {cache_file}: {e}")
+            if tmp_path is not None:
+                self._remove_audio_file(tmp_path)
     
-    def clear_old_cache(self, current_idx):
-        """Remove cached files for sentences we've passed"""
+    def _remove_audio_file(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def store_audio(self, sentence_idx, path, epoch):
+        """Remember a sentence's cached file; only the last cache_ahead * 2 are kept in memory"""
         with self.cache_lock:
-            to_remove = [idx for idx in self.audio_cache if idx < current_idx - 1]
-            for idx in to_remove:
-                try:
-                    if os.path.exists(self.audio_cache[idx]):
-                        os.remove(self.audio_cache[idx])
-                except:
-                    pass
-                del self.audio_cache[idx]
-
+            if epoch != self.audio_cache_epoch:
+                return  # Synthesized for sentences that have since been re-analyzed
+            self.audio_cache[sentence_idx] = path
+            while len(self.audio_cache) > self.cache_ahead * 2:
+                self.audio_cache.popitem(last=False)
+    
+    def _wake_playback(self):
+        """Interrupt playback's waits after a stop or skip"""
+        self.playback_wakeup.set()
+        with self.cache_lock:
+            self.audio_ready.notify_all()
+    
+    def clear_audio_cache(self):
+        """Forget which sentence index maps to which file (the files stay cached on disk)"""
+        with self.cache_lock:
+            self.audio_cache_epoch += 1
+            self.audio_cache.clear()
+    
+    def submit_tts(self, start_idx):
+        """Pre-cache audio for the next cache_ahead sentences, concurrently"""
+        asyncio.run_coroutine_threadsafe(
+            self._prefetch(start_idx, self.playback_generation), self.tts_loop)
+    
+    async def _prefetch(self, start_idx, generation):
+        end_idx = min(start_idx + self.cache_ahead, len(self.sentences))
+        await asyncio.gather(*(self._synth(i, generation) for i in range(start_idx, end_idx)))
+    
+    async def _synth(self, sentence_idx, generation):
+        """Generate and cache audio for a specific sentence (runs on the TTS loop)"""
+        with self.cache_lock:
+            if sentence_idx in self.audio_cache or sentence_idx in self.tts_pending:
+                return  # Already cached or in flight
+            self.tts_pending.add(sentence_idx)
+            epoch = self.audio_cache_epoch
+        
+        tmp_path = None
+        try:
+            cache_file = self.get_cache_file(sentence_idx)
+            if not self._touch_cached_audio(cache_file):
+                async with self.tts_semaphore:
+                    # Skip work for a playback run that was stopped or skipped meanwhile
+                    if self.stop_signal or self.playback_generation != generation:
+                        return
+                    tmp_path = self._temp_audio_file()
+                    await self.generate_audio(self.sentences[sentence_idx].text, tmp_path)
+                    os.replace(tmp_path, cache_file)
+                    tmp_path = None
+            self.store_audio(sentence_idx, cache_file, epoch)
+        except Exception as e:
+            print(f"Cache error for sentence {sentence_idx}: {e}")
+        finally:
+            if tmp_path is not None:  # Failed or cancelled mid-synthesis
+                self._remove_audio_file(tmp_path)
+            with self.cache_lock:
+                self.tts_pending.discard(sentence_idx)
+                self.audio_ready.notify_all()
+    
     def playback_loop(self):
         # Pre-cache first few sentences
-        self.start_cache_worker(self.current_sentence_idx)
+        self.submit_tts(self.current_sentence_idx)
         
         # Track generation at start
         my_generation = self.playback_generation
@@ -1395,7 +1821,7 @@ class VisualEdgeReader:
             sentence = self.sentences[playing_idx]
             
             # Make sure the page containing this sentence is loaded
-            if sentence.page_num not in self.loaded_pages:
+            if sentence.page_num not in self.pages:
                 self.root.after(0, lambda pn=sentence.page_num: self.render_single_page(pn))
                 pygame.time.wait(100)
             
@@ -1404,30 +1830,46 @@ class VisualEdgeReader:
             
             # Check if audio is cached, if not generate it now
             with self.cache_lock:
+                # Wait for an in-flight prefetch rather than requesting the same sentence twice
+                while (playing_idx in self.tts_pending and playing_idx not in self.audio_cache
+                       and not self.stop_signal and self.playback_generation == my_generation):
+                    self.audio_ready.wait()
                 cached_file = self.audio_cache.get(playing_idx)
+                if cached_file:
+                    self.audio_cache.move_to_end(playing_idx)  # Evict passed sentences first
+            if self.stop_signal or self.playback_generation != my_generation:
+                continue
+            if not cached_file:
+                # Heard in an earlier session?
+                cache_file = self.get_cache_file(playing_idx)
+                if self._touch_cached_audio(cache_file):
+                    cached_file = cache_file
             
             try:
                 if cached_file and os.path.exists(cached_file):
                     # Use cached audio
                     pygame.mixer.music.load(cached_file)
                 else:
-                    # Generate on the fly (fallback)
-                    self.run_async_generation(sentence.text, self.audio_file)
+                    # Generate on the fly (fallback), streamed straight into memory
+                    audio = asyncio.run_coroutine_threadsafe(
+                        self.stream_audio(sentence.text, my_generation), self.tts_loop).result()
                     
                     # Check if invalidated during generation - skip if so
-                    if self.playback_generation != my_generation or self.stop_signal:
+                    if audio is None or self.playback_generation != my_generation or self.stop_signal:
                         continue
                     
-                    pygame.mixer.music.load(self.audio_file)
+                    self._save_audio(self.get_cache_file(playing_idx), audio.getvalue())
+                    pygame.mixer.music.load(audio, "mp3")
                 
                 # Final check before playing - skip if invalidated
                 if self.playback_generation != my_generation or self.stop_signal:
                     continue
                 
+                self.playback_wakeup.clear()
                 pygame.mixer.music.play()
                 
                 # Start caching next sentences while playing
-                self.start_cache_worker(self.current_sentence_idx + 1)
+                self.submit_tts(self.current_sentence_idx + 1)
                 
             except Exception as e:
                 error_msg = str(e)
@@ -1446,20 +1888,18 @@ class VisualEdgeReader:
                 if self.playback_generation != my_generation:
                     pygame.mixer.music.stop()
                     break
-                pygame.time.Clock().tick(10)
+                # Stop/skip set the event and wake us at once; otherwise poll for the end
+                self.playback_wakeup.wait(0.05)
 
             if self.stop_signal or self.playback_generation != my_generation:
                 break
             
-            # Clean up old cache
-            self.clear_old_cache(self.current_sentence_idx)
-            
             self.current_sentence_idx += 1
             
             # Check if we need to load more pages for upcoming sentences
             if self.current_sentence_idx < len(self.sentences):
                 next_sentence = self.sentences[self.current_sentence_idx]
-                if next_sentence.page_num not in self.loaded_pages:
+                if next_sentence.page_num not in self.pages:
                     self.root.after(0, lambda: self.check_and_load_more_pages())
         
         self.stop_signal = True
@@ -1478,6 +1918,7 @@ class VisualEdgeReader:
                 pygame.mixer.music.stop()
             
             self.playback_generation += 1
+            self._wake_playback()
             self.current_sentence_idx += 1
             self.draw_highlight()
 
@@ -1489,6 +1930,7 @@ class VisualEdgeReader:
                 pygame.mixer.music.stop()
             
             self.playback_generation += 1
+            self._wake_playback()
             self.current_sentence_idx -= 1
             self.draw_highlight()
     
@@ -1498,6 +1940,7 @@ class VisualEdgeReader:
         self.sidebar_resizing = True
         self.resize_start_x = event.x_root
         self.resize_start_width = self.sidebar_width
+        self._place_resize_indicator()
     
     def do_sidebar_resize(self, event):
         """Handle sidebar resize drag"""
@@ -1507,16 +1950,39 @@ class VisualEdgeReader:
         delta = event.x_root - self.resize_start_x
         new_width = max(150, min(600, self.resize_start_width + delta))
         self.sidebar_width = new_width
-        self.sidebar.config(width=new_width)
+        # Only the indicator line follows the drag; the layout changes once on release
+        self._place_resize_indicator()
+    
+    def _place_resize_indicator(self):
+        self.resize_indicator.place(x=self.sidebar_width, y=0, width=2, relheight=1)
+        self.resize_indicator.lift()
     
     def end_sidebar_resize(self, event):
         """End sidebar resize and save width"""
+        if not self.sidebar_resizing:
+            return
         self.sidebar_resizing = False
+        self.resize_indicator.place_forget()
+        self.sidebar.config(width=self.sidebar_width)
         self.db.set_setting("sidebar_width", self.sidebar_width)
     
+    def _show_dialog(self, name, build):
+        """Show a dialog, building it with build() -> (window, refresh) on first use"""
+        win, refresh = self.dialogs.get(name, (None, None))
+        if win is None or not win.winfo_exists():
+            win, refresh = build()
+            self.dialogs[name] = (win, refresh)
+        else:
+            win.deiconify()
+            win.lift()
+        refresh()
+    
     # --- Margin settings ---
     def show_margin_settings(self):
         """Show dialog to configure header/footer margins for TTS"""
+        self._show_dialog("margins", self._build_margin_settings)
+    
+    def _build_margin_settings(self):
         margin_win = tk.Toplevel(self.root)
         margin_win.title("TTS Text Margins")
         margin_win.geometry("400x300")
@@ -1534,24 +2000,24 @@ class VisualEdgeReader:
         header_frame.pack(fill=tk.X, padx=20, pady=10)
         tk.Label(header_frame, text="Header margin (pts):", bg="#2d2d30", fg="white",
                 font=("Arial", 10)).pack(side=tk.LEFT)
-        header_var = tk.DoubleVar(value=self.header_margin)
+        header_var = tk.DoubleVar()
         header_scale = tk.Scale(header_frame, from_=0, to=150, orient=tk.HORIZONTAL,
                                variable=header_var, bg="#3d3d3d", fg="white",
                                highlightthickness=0, length=200)
         header_scale.pack(side=tk.RIGHT)
-        header_scale.bind("<Motion>", lambda e: self.preview_margins(header_var.get(), footer_var.get()))
+        header_scale.bind("<Motion>", lambda e: self.queue_margin_preview(header_var.get(), footer_var.get()))
         
         # Footer margin
         footer_frame = tk.Frame(margin_win, bg="#2d2d30")
         footer_frame.pack(fill=tk.X, padx=20, pady=10)
         tk.Label(footer_frame, text="Footer margin (pts):", bg="#2d2d30", fg="white",
                 font=("Arial", 10)).pack(side=tk.LEFT)
-        footer_var = tk.DoubleVar(value=self.footer_margin)
+        footer_var = tk.DoubleVar()
         footer_scale = tk.Scale(footer_frame, from_=0, to=150, orient=tk.HORIZONTAL,
                                variable=footer_var, bg="#3d3d3d", fg="white",
                                highlightthickness=0, length=200)
         footer_scale.pack(side=tk.RIGHT)
-        footer_scale.bind("<Motion>", lambda e: self.preview_margins(header_var.get(), footer_var.get()))
+        footer_scale.bind("<Motion>", lambda e: self.queue_margin_preview(header_var.get(), footer_var.get()))
         
         # Buttons
         btn_frame = tk.Frame(margin_win, bg="#2d2d30")
@@ -1561,70 +2027,111 @@ class VisualEdgeReader:
             self.header_margin = header_var.get()
             self.footer_margin = footer_var.get()
             # Save per-book margins
-            if self.current_pdf_path:
-                self.db.update_book_progress(
-                    self.current_pdf_path,
-                    self.get_visible_page(),
-                    self.current_sentence_idx,
-                    header_margin=self.header_margin,
-                    footer_margin=self.footer_margin
-                )
+            self.queue_progress(header_margin=self.header_margin, footer_margin=self.footer_margin)
             # Re-analyze sentences for loaded pages
-            self.sentences.clear()
-            for page_num in self.loaded_pages:
-                page = self.doc.load_page(page_num)
-                y_offset = self.page_offsets.get(page_num, page_num * self.estimated_page_height)
-                self.analyze_page_sentences(page, page_num, y_offset)
-            self.canvas.delete("margin_preview")
-            margin_win.destroy()
+            self.clear_sentences()
+            for page_num, page in self.pages.items():
+                self.analyze_page_sentences(page_num, page.offset)
+            self.cancel_margin_preview()
+            self.clear_margin_preview()
+            margin_win.withdraw()
         
         def cancel():
-            self.canvas.delete("margin_preview")
-            margin_win.destroy()
+            self.cancel_margin_preview()
+            self.clear_margin_preview()
+            margin_win.withdraw()
         
         ttk.Button(btn_frame, text="Apply", command=apply_margins).pack(side=tk.LEFT, padx=10)
         ttk.Button(btn_frame, text="Cancel", command=cancel).pack(side=tk.LEFT)
         
         # Clean up preview on window close
         margin_win.protocol("WM_DELETE_WINDOW", cancel)
+        
+        def refresh():
+            header_var.set(self.header_margin)
+            footer_var.set(self.footer_margin)
+        
+        return margin_win, refresh
+    
+    def queue_margin_preview(self, header, footer):
+        """Record the latest slider values; the preview is redrawn at most every DRAG_THROTTLE_MS"""
+        self.margin_preview_values = (header, footer)
+        if self.margin_preview_id is None:
+            self.margin_preview_id = self.root.after(DRAG_THROTTLE_MS, self._flush_margin_preview)
+    
+    def _flush_margin_preview(self):
+        self.margin_preview_id = None
+        self.preview_margins(*self.margin_preview_values)
+    
+    def cancel_margin_preview(self):
+        if self.margin_preview_id is not None:
+            self.root.after_cancel(self.margin_preview_id)
+            self.margin_preview_id = None
     
     def preview_margins(self, header, footer):
         """Show visual preview of margin exclusion zones"""
-        self.canvas.delete("margin_preview")
-        
-        if not self.doc or not self.loaded_pages:
+        header_height = int(header * self.zoom_level)
+        footer_height = int(footer * self.zoom_level)
+        if not self.doc or not self.pages or (header_height <= 0 and footer_height <= 0):
+            self.clear_margin_preview()  # Nothing to show, and scrolling won't re-preview
             return
         
-        canvas_width = self.canvas.winfo_width()
-        x_offset = max(0, (canvas_width - self.page_width) // 2)
-        
-        for page_num in self.loaded_pages:
-            y_offset = self.page_offsets.get(page_num, page_num * self.estimated_page_height)
-            page = self.doc.load_page(page_num)
-            page_height = page.rect.height * self.zoom_level
+        # Only pages on screen get overlays; scrolling previews again
+        visible = self._visible_pages()
+        for page_num in [pn for pn in self.margin_items if pn not in visible]:
+            self.canvas.delete(*self.margin_items.pop(page_num))
+        
+        x_offset = self._x_offset(self.page_width)
+        
+        # Every page shares one translucent image per zone, stretched natively from a
+        # 1 px strip; only the two in use are kept
+        if self.margin_strip is None or self.margin_strip.width() != self.page_width:
+            png = io.BytesIO()
+            Image.new("RGBA", (self.page_width, 1), MARGIN_PREVIEW_RGBA).save(png, format="PNG")
+            self.margin_strip = tk.PhotoImage(data=png.getvalue())
+            self.margin_overlays = {}
+        overlays = {}
+        for height in (header_height, footer_height):
+            if height > 0:
+                overlays[height] = self.margin_overlays.get(height) or self.margin_strip.zoom(1, height)
+        self.margin_overlays = overlays
+        
+        for page_num in visible:
+            page = self.pages[page_num]
+            items = self.margin_items.get(page_num)
+            if items is None:
+                items = tuple(self.canvas.create_image(0, 0, anchor=tk.NW, tags="margin_preview")
+                              for _ in range(2))
+                self.margin_items[page_num] = items
+            header_item, footer_item = items
             
             # Header exclusion zone
-            if header > 0:
-                self.canvas.create_rectangle(
-                    x_offset, y_offset,
-                    x_offset + self.page_width, y_offset + header * self.zoom_level,
-                    fill="#ff4444", stipple="gray50", outline="#ff0000",
-                    tags="margin_preview"
-                )
+            if header_height > 0:
+                self.canvas.coords(header_item, x_offset, page.offset)
+                self.canvas.itemconfigure(header_item, state=tk.NORMAL,
+                                          image=overlays[header_height])
+            else:
+                self.canvas.itemconfigure(header_item, state=tk.HIDDEN)
             
             # Footer exclusion zone
-            if footer > 0:
-                footer_y = y_offset + page_height - footer * self.zoom_level
-                self.canvas.create_rectangle(
-                    x_offset, footer_y,
-                    x_offset + self.page_width, y_offset + page_height,
-                    fill="#ff4444", stipple="gray50", outline="#ff0000",
-                    tags="margin_preview"
-                )
+            if footer_height > 0:
+                self.canvas.coords(footer_item, x_offset, page.offset + page.height - footer_height)
+                self.canvas.itemconfigure(footer_item, state=tk.NORMAL,
+                                          image=overlays[footer_height])
+            else:
+                self.canvas.itemconfigure(footer_item, state=tk.HIDDEN)
+    
+    def clear_margin_preview(self):
+        self.canvas.delete("margin_preview")
+        self.margin_items.clear()
+        self.margin_overlays = {}
     
     # --- Brightness settings ---
     def show_brightness_settings(self):
         """Show dialog to adjust screen brightness for eye comfort"""
+        self._show_dialog("brightness", self._build_brightness_settings)
+    
+    def _build_brightness_settings(self):
         bright_win = tk.Toplevel(self.root)
         bright_win.title("Brightness")
         bright_win.geometry("350x220")
@@ -1643,7 +2150,7 @@ class VisualEdgeReader:
         
         tk.Label(slider_frame, text="🔅", bg="#2d2d30", fg="white", font=("Arial", 14)).pack(side=tk.LEFT)
         
-        brightness_var = tk.DoubleVar(value=self.brightness)
+        brightness_var = tk.DoubleVar()
         brightness_scale = tk.Scale(slider_frame, from_=0.3, to=1.0, resolution=0.05,
                                    orient=tk.HORIZONTAL, variable=brightness_var,
                                    bg="#3d3d3d", fg="white", highlightthickness=0, length=200)
@@ -1659,62 +2166,56 @@ class VisualEdgeReader:
         brightness_scale.bind("<ButtonRelease-1>", apply_brightness)
         
         # Close button
-        ttk.Button(bright_win, text="Close", command=bright_win.destroy).pack(pady=10)
+        ttk.Button(bright_win, text="Close", command=bright_win.withdraw).pack(pady=10)
+        bright_win.protocol("WM_DELETE_WINDOW", bright_win.withdraw)
+        
+        return bright_win, lambda: brightness_var.set(self.brightness)
     
     def rerender_loaded_pages(self):
         """Re-render all loaded pages with current brightness"""
         if not self.doc:
             return
         
-        # Store current scroll position
-        scroll_pos = self.canvas.yview()[0]
-        
-        # Re-render each loaded page
-        for page_num in list(self.loaded_pages):
-            page = self.doc.load_page(page_num)
-            mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-            pix = page.get_pixmap(matrix=mat)
-            
-            img_data = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            self.page_pil_images[page_num] = img_data.copy()
-            
-            # Apply brightness
-            if self.brightness < 1.0:
-                enhancer = ImageEnhance.Brightness(img_data)
-                img_data = enhancer.enhance(self.brightness)
-            
-            photo = ImageTk.PhotoImage(img_data)
-            self.page_images[page_num] = photo
-            
-            y_offset = self.page_offsets.get(page_num, page_num * self.estimated_page_height)
-            canvas_width = self.canvas.winfo_width()
-            x_offset = max(0, (canvas_width - pix.width) // 2)
-            
-            self.canvas.delete(f"page_{page_num}")
-            self.canvas.create_image(x_offset, y_offset, image=photo, anchor=tk.NW, tags=f"page_{page_num}")
-        
-        # Restore scroll position
-        self.canvas.yview_moveto(scroll_pos)
+        # The page cache holds undimmed rasters, so this is usually a decode and a tint
+        # on the render pool; each page's image is swapped in place when it is ready.
+        # Only on-screen pages are redone now, the rest as they scroll into view.
+        self.stale_pages.update(self.pages)
+        self.refresh_stale_pages()
     
     # --- Progress saving ---
     def save_current_progress(self):
-        """Save current reading progress to database"""
+        """Save current reading progress to database now"""
+        self.pending_progress["zoom_level"] = self.zoom_level
+        self.flush_progress()
+    
+    def queue_progress(self, **fields):
+        """Record a progress change; it is written on the next flush"""
+        self.pending_progress.update(fields)
+        if self.progress_flush_id is None:
+            self.progress_flush_id = self.root.after(PROGRESS_FLUSH_MS, self.flush_progress)
+    
+    def flush_progress(self):
+        """Write the visible page, sentence and any queued fields in one UPDATE"""
+        if self.progress_flush_id is not None:
+            self.root.after_cancel(self.progress_flush_id)
+            self.progress_flush_id = None
         if self.current_pdf_path and self.doc:
-            visible_page = self.get_visible_page()
             self.db.update_book_progress(
                 self.current_pdf_path,
-                visible_page,
+                self.get_visible_page(),
                 self.current_sentence_idx,
-                self.zoom_level
+                **self.pending_progress
             )
+        self.pending_progress.clear()
     
     # --- Library view ---
     def show_library(self):
         """Show library window with all books"""
         # Save current progress first
         self.save_current_progress()
-        
-        # Create library window
+        self._show_dialog("library", self._build_library)
+    
+    def _build_library(self):
         library_win = tk.Toplevel(self.root)
         library_win.title("PDF Library")
         library_win.geometry("800x600")
@@ -1736,154 +2237,231 @@ class VisualEdgeReader:
                                insertbackground="white", font=("Arial", 11), width=40)
         search_entry.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
         
-        # Book list
+        # Book list: one Treeview row per book, thumbnail in the tree column
         list_frame = tk.Frame(library_win, bg="#2d2d30")
         list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        # Scrollable canvas for books
-        canvas = tk.Canvas(list_frame, bg="#2d2d30", highlightthickness=0)
-        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#2d2d30")
-        
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Mouse wheel scrolling for library
-        def on_library_scroll(event):
-            if event.num == 4:  # Linux scroll up
-                canvas.yview_scroll(-1, "units")
-            elif event.num == 5:  # Linux scroll down
-                canvas.yview_scroll(1, "units")
-            else:  # Windows/Mac
-                canvas.yview_scroll(-1 * (event.delta // 120), "units")
-        
-        canvas.bind("<Button-4>", on_library_scroll)
-        canvas.bind("<Button-5>", on_library_scroll)
-        canvas.bind("<MouseWheel>", on_library_scroll)
-        scrollable_frame.bind("<Button-4>", on_library_scroll)
-        scrollable_frame.bind("<Button-5>", on_library_scroll)
-        scrollable_frame.bind("<MouseWheel>", on_library_scroll)
-        
+        style = ttk.Style(library_win)
+        style.configure("Library.Treeview", background="#3d3d3d", fieldbackground="#2d2d30",
+                        foreground="white", font=("Arial", 11), rowheight=THUMB_HEIGHT + 10)
+        style.map("Library.Treeview", background=[("selected", "#0078d7")])
+        
+        tree = ttk.Treeview(list_frame, columns=("progress", "path"), show="tree headings",
+                            selectmode="browse", style="Library.Treeview")
+        tree.heading("#0", text="Title", anchor="w")
+        tree.heading("progress", text="Progress", anchor="w")
+        tree.heading("path", text="Location", anchor="w")
+        tree.column("#0", width=320)
+        tree.column("progress", width=130, stretch=False)
+        tree.column("path", width=280)
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Load all books from database (sorted by recently opened)
-        all_books = self.db.get_all_books()
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Shown over the list when it has no rows
+        empty_label = tk.Label(list_frame, bg="#2d2d30", fg="#888", font=("Arial", 12))
+        
+        library_win.protocol("WM_DELETE_WINDOW", lambda: self._hide_library(library_win))
+        
+        all_books = []
+        search_keys = []
+        book_paths = {}  # Row id -> book path
+        thumbnails = {}  # Book path -> PhotoImage (None if it has none); kept across reloads
+        if self.thumb_placeholder is None:
+            self.thumb_placeholder = tk.PhotoImage(width=THUMB_HEIGHT * 3 // 4, height=THUMB_HEIGHT)
+        
+        def request_thumbnail(iid, path):
+            thumbnails[path] = None
+            generation = self.library_generation
+            future = self.thumb_pool.submit(self._get_thumbnail, path, generation)
+            future.add_done_callback(partial(self._queue_thumbnail, partial(set_thumbnail, iid, path, generation)))
+        
+        def set_thumbnail(iid, path, generation, img):
+            if generation != self.library_generation:
+                # Skipped because the library was hidden while it was queued
+                if library_win.state() == "withdrawn":
+                    thumbnails.pop(path, None)  # Requested again by the next reload
+                else:
+                    request_thumbnail(iid, path)
+                return
+            thumbnails[path] = ImageTk.PhotoImage(img) if img is not None else None
+            if thumbnails[path] is not None and tree.exists(iid):
+                tree.item(iid, image=thumbnails[path])
         
         def refresh_book_list(*args):
-            """Filter and display books based on search query"""
-            # Clear existing cards
-            for widget in scrollable_frame.winfo_children():
-                widget.destroy()
-            
+            """Filter the rows based on search query (rows are moved, never rebuilt)"""
             query = search_var.get().lower()
-            filtered_books = [b for b in all_books if query in (b['title'] or '').lower() or query in b['path'].lower()]
+            matches = [str(b['id']) for b, (title, path) in zip(all_books, search_keys)
+                       if query in title or query in path]
+            shown = tree.get_children()
+            if shown:
+                tree.detach(*shown)
+            for index, iid in enumerate(matches):
+                tree.move(iid, "", index)
             
-            if not filtered_books:
+            if not matches:
                 if not all_books:
                     msg = "No books in library.\nClick '+ Add PDF' to add your first book."
                 else:
                     msg = "No books match your search."
-                tk.Label(scrollable_frame, text=msg, bg="#2d2d30", fg="#888", font=("Arial", 12)).pack(pady=50)
+                empty_label.config(text=msg)
+                empty_label.place(relx=0.5, y=50, anchor="n")
             else:
-                for book in filtered_books:
-                    self._create_book_card(scrollable_frame, book, library_win, on_library_scroll)
-        
-        # Bind search to key release
-        search_var.trace_add("write", refresh_book_list)
-        
-        # Initial display
-        refresh_book_list()
+                empty_label.place_forget()
+        
+        # Refresh once typing pauses instead of on every keystroke
+        search_after_id = None
+        
+        def schedule_refresh(*args):
+            nonlocal search_after_id
+            if search_after_id is not None:
+                library_win.after_cancel(search_after_id)
+            search_after_id = library_win.after(SEARCH_DEBOUNCE_MS, run_refresh)
+        
+        def run_refresh():
+            nonlocal search_after_id
+            search_after_id = None
+            if library_win.winfo_exists():
+                refresh_book_list()
+        
+        search_var.trace_add("write", schedule_refresh)
+        
+        def reload_books():
+            nonlocal all_books, search_keys
+            # Load all books from database (sorted by recently opened)
+            all_books = self.db.get_all_books()
+            # Lowercased (title, path) per book, built once rather than per keystroke
+            search_keys = [((b['title'] or '').lower(), b['path'].lower()) for b in all_books]
+            
+            if book_paths:
+                tree.delete(*book_paths)  # Includes rows detached by the search filter
+            book_paths.clear()
+            for book in all_books:
+                iid = str(book['id'])
+                path = book['path']
+                book_paths[iid] = path
+                
+                path_display = path
+                if len(path_display) > 60:
+                    path_display = "..." + path_display[-57:]
+                progress = f"Page {book['last_page'] + 1} of {book['total_pages']}" if book['total_pages'] > 0 else "Not opened yet"
+                
+                # Thumbnail of the first page, filled in by thumb_pool the first time
+                if path not in thumbnails:
+                    request_thumbnail(iid, path)
+                tree.insert("", tk.END, iid=iid, text=book['title'] or Path(path).stem,
+                            image=thumbnails[path] or self.thumb_placeholder,
+                            values=(progress, path_display))
+            refresh_book_list()
+        
+        def selected_path():
+            selection = tree.selection()
+            return book_paths[selection[0]] if selection else None
+        
+        def open_selected(event=None):
+            path = selected_path()
+            if path:
+                self._open_from_library(path, library_win)
+        
+        def remove_selected():
+            path = selected_path()
+            if path and self._remove_from_library(path):
+                thumbnails.pop(path, None)
+                reload_books()
+        
+        tree.bind("<Double-1>", open_selected)
+        tree.bind("<Return>", open_selected)
+        ttk.Button(header, text="Remove", command=remove_selected).pack(side=tk.RIGHT)
+        ttk.Button(header, text="Open", command=open_selected).pack(side=tk.RIGHT, padx=5)
+        
+        return library_win, reload_books
     
-    def _create_book_card(self, parent, book, library_win, scroll_handler=None):
-        """Create a card for a book in the library with thumbnail"""
-        card = tk.Frame(parent, bg="#3d3d3d", pady=10, padx=15)
-        card.pack(fill=tk.X, pady=5)
-        
-        # Generate thumbnail from first page
-        thumbnail_label = None
+    def _queue_thumbnail(self, callback, future):
+        """Done-callback (worker thread): pass the thumbnail to callback on the Tk thread"""
+        if future.cancelled():
+            return
+        try:
+            self.root.after(0, callback, future.result())
+        except (RuntimeError, tk.TclError):
+            pass  # Window already closed
+    
+    def _get_thumbnail(self, path, generation):
+        """First-page thumbnail of a PDF, from THUMB_CACHE_DIR when the file is unchanged"""
+        if generation != self.library_generation:
+            return None  # Library hidden while queued
         try:
-            if os.path.exists(book['path']):
-                doc = fitz.open(book['path'])
+            if not os.path.exists(path):
+                return None
+            key = hashlib.sha1(f"{path}:{os.path.getmtime(path)}".encode()).hexdigest()
+            cache_path = THUMB_CACHE_DIR / f"{key}.png"
+            if cache_path.exists():
+                with Image.open(cache_path) as img:
+                    img.load()
+                os.utime(cache_path)  # Keep recently shown thumbnails when pruning
+                return img
+            
+            with self.doc_lock:
+                if generation != self.library_generation:
+                    return None  # Don't reopen documents _hide_library just closed
+                doc = self._library_doc(path)
+                pix = None
                 if len(doc) > 0:
                     page = doc.load_page(0)
-                    # Render at low resolution for thumbnail
-                    mat = fitz.Matrix(0.2, 0.2)  # 20% scale
-                    pix = page.get_pixmap(matrix=mat)
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    # Resize to fixed height while maintaining aspect ratio
-                    thumb_height = 80
-                    aspect = img.width / img.height
-                    thumb_width = int(thumb_height * aspect)
-                    img = img.resize((thumb_width, thumb_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    thumbnail_label = tk.Label(card, image=photo, bg="#3d3d3d")
-                    thumbnail_label.image = photo  # Keep reference
-                    thumbnail_label.pack(side=tk.LEFT, padx=(0, 15))
-                doc.close()
+                    # Rasterize straight at thumbnail height; MuPDF antialiases, so no resample is needed
+                    scale = THUMB_HEIGHT / page.rect.height
+                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csRGB, alpha=False)
+            if pix is None:
+                return None
+            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            
+            THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, cache_path)
+            return img
         except Exception as e:
             print(f"Thumbnail error: {e}")
-        
-        # Book info (truncate long titles/paths)
-        title = book['title'] or Path(book['path']).stem
-        if len(title) > 50:
-            title = title[:47] + "..."
-        
-        path_display = book['path']
-        if len(path_display) > 60:
-            path_display = "..." + path_display[-57:]
-        
-        progress = f"Page {book['last_page'] + 1} of {book['total_pages']}" if book['total_pages'] > 0 else "Not opened yet"
-        
-        info_frame = tk.Frame(card, bg="#3d3d3d")
-        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        tk.Label(info_frame, text=title, bg="#3d3d3d", fg="white",
-                font=("Arial", 12, "bold"), anchor="w").pack(fill=tk.X)
-        tk.Label(info_frame, text=progress, bg="#3d3d3d", fg="#aaa",
-                font=("Arial", 10), anchor="w").pack(fill=tk.X)
-        tk.Label(info_frame, text=path_display, bg="#3d3d3d", fg="#666",
-                font=("Arial", 8), anchor="w").pack(fill=tk.X)
-        
-        # Buttons
-        btn_frame = tk.Frame(card, bg="#3d3d3d")
-        btn_frame.pack(side=tk.RIGHT)
-        
-        ttk.Button(btn_frame, text="Open", 
-                  command=lambda p=book['path']: self._open_from_library(p, library_win)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Remove",
-                  command=lambda p=book['path'], c=card: self._remove_from_library(p, c)).pack(side=tk.LEFT)
-        
-        # Make card clickable and scrollable
-        clickable_widgets = [card, info_frame] + list(info_frame.winfo_children())
-        if thumbnail_label:
-            clickable_widgets.append(thumbnail_label)
-        for widget in clickable_widgets:
-            widget.bind("<Button-1>", lambda e, p=book['path']: self._open_from_library(p, library_win))
-            widget.configure(cursor="hand2")
-            # Bind scroll events
-            if scroll_handler:
-                widget.bind("<Button-4>", scroll_handler)
-                widget.bind("<Button-5>", scroll_handler)
-                widget.bind("<MouseWheel>", scroll_handler)
+            return None
     
     def _add_book_to_library(self, library_win):
         """Add a new book to library"""
         filename = filedialog.askopenfilename(filetypes=[("PDF Files", "*.pdf")])
         if filename:
-            # Add to database
-            doc = fitz.open(filename)
-            self.db.add_book(filename, total_pages=len(doc))
-            doc.close()
+            # Add to database (the document stays open for its thumbnail)
+            with self.doc_lock:
+                total_pages = len(self._library_doc(filename))
+            self.db.add_book(filename, total_pages=total_pages)
             # Refresh library view
-            library_win.destroy()
             self.show_library()
     
+    def _library_doc(self, path):
+        """Open a PDF for the library, reusing recently opened ones while unchanged (hold doc_lock)"""
+        mtime = os.path.getmtime(path)
+        entry = self.library_docs.get(path)
+        if entry is not None:
+            if entry[0] == mtime:
+                self.library_docs.move_to_end(path)
+                return entry[1]
+            entry[1].close()
+        doc = fitz.open(path)
+        self.library_docs[path] = (mtime, doc)
+        if len(self.library_docs) > LIBRARY_DOC_CACHE:
+            self.library_docs.popitem(last=False)[1][1].close()
+        return doc
+    
+    def _hide_library(self, library_win):
+        """Withdraw the library window and close the documents it opened"""
+        library_win.withdraw()
+        with self.doc_lock:
+            self.library_generation += 1  # Queued thumbnails now skip opening documents
+            for mtime, doc in self.library_docs.values():
+                doc.close()
+            self.library_docs.clear()
+    
     def _open_from_library(self, path, library_win):
         """Open a book from the library"""
-        library_win.destroy()
+        self._hide_library(library_win)
         
         # If it's the same book, just close library - don't reopen
         if path == self.current_pdf_path and self.doc:
@@ -1891,15 +2469,19 @@ class VisualEdgeReader:
         
         self.open_pdf(path)
     
-    def _remove_from_library(self, path, card):
-        """Remove a book from library"""
-        if messagebox.askyesno("Remove Book", "Remove this book from your library?"):
-            self.db.remove_book(path)
-            card.destroy()
+    def _remove_from_library(self, path):
+        """Remove a book from library; True if the user confirmed"""
+        if not messagebox.askyesno("Remove Book", "Remove this book from your library?"):
+            return False
+        self.db.remove_book(path)
+        return True
     
     # --- Voice settings ---
     def show_voice_settings(self):
         """Show voice selection dialog"""
+        self._show_dialog("voice", self._build_voice_settings)
+    
+    def _build_voice_settings(self):
         voice_win = tk.Toplevel(self.root)
         voice_win.title("Voice Settings")
         voice_win.geometry("500x400")
@@ -1912,8 +2494,8 @@ class VisualEdgeReader:
                 font=("Arial", 14, "bold")).pack(side=tk.LEFT, padx=20)
         
         # Current voice indicator
-        tk.Label(voice_win, text=f"Current: {self.voice}", bg="#2d2d30", fg="#aaa",
-                font=("Arial", 10)).pack(pady=5)
+        current_label = tk.Label(voice_win, bg="#2d2d30", fg="#aaa", font=("Arial", 10))
+        current_label.pack(pady=5)
         
         # Voice list
         list_frame = tk.Frame(voice_win, bg="#2d2d30")
@@ -1932,31 +2514,63 @@ class VisualEdgeReader:
         def load_voices():
             try:
                 voices = asyncio.run(edge_tts.list_voices())
-                # Sort by locale/language
+                # Keep only what the list shows, sorted by locale/language
+                voices = [{k: v[k] for k in ('Locale', 'ShortName', 'Gender')} for v in voices]
                 voices.sort(key=lambda v: (v['Locale'], v['ShortName']))
                 
-                voice_win.after(0, lambda: populate_list(voices))
+                voice_win.after(0, lambda: store_and_populate(voices))
             except Exception as e:
-                voice_win.after(0, lambda: voice_listbox.insert(tk.END, f"Error loading voices: {e}"))
+                error_msg = f"Error loading voices: {e}"
+                voice_win.after(0, lambda: voice_listbox.insert(tk.END, error_msg))
+        
+        def store_and_populate(voices):
+            # The DB connection belongs to this (Tk) thread
+            with self.db.batch():
+                self.db.set_setting("voice_cache_json", json.dumps(voices))
+                self.db.set_setting("voice_cache_ts", time.time())
+            if voice_win.winfo_exists():
+                populate_list(voices)
+        
+        voice_rows = {}  # ShortName -> listbox index, empty until the list is filled
         
         def populate_list(voices):
+            items = []
+            voice_rows.clear()
             current_locale = ""
             for v in voices:
                 locale = v['Locale']
                 if locale != current_locale:
                     current_locale = locale
-                    voice_listbox.insert(tk.END, f"── {locale} ──")
-                
-                display_name = f"  {v['ShortName']} ({v['Gender']})"
-                voice_listbox.insert(tk.END, display_name)
+                    items.append(f"── {locale} ──")
                 
-                # Select current voice
-                if v['ShortName'] == self.voice:
-                    voice_listbox.selection_set(tk.END)
-                    voice_listbox.see(tk.END)
-        
-        voice_listbox.insert(tk.END, "Loading voices...")
-        threading.Thread(target=load_voices, daemon=True).start()
+                items.append(f"  {v['ShortName']} ({v['Gender']})")
+                voice_rows[v['ShortName']] = len(items) - 1
+            
+            # One Tcl call for the whole list
+            voice_listbox.delete(0, tk.END)
+            voice_listbox.insert(tk.END, *items)
+            select_current_voice()
+        
+        def select_current_voice():
+            voice_listbox.selection_clear(0, tk.END)
+            row = voice_rows.get(self.voice)
+            if row is not None:
+                voice_listbox.selection_set(row)
+                voice_listbox.see(row)
+        
+        def refresh():
+            current_label.config(text=f"Current: {self.voice}")
+            if voice_rows:
+                select_current_voice()
+                return
+            # Reuse the voice list fetched within the last VOICE_CACHE_TTL
+            cached_at = float(self.db.get_setting("voice_cache_ts", 0))
+            if time.time() - cached_at < VOICE_CACHE_TTL:
+                populate_list(json.loads(self.db.get_setting("voice_cache_json")))
+            else:
+                voice_listbox.delete(0, tk.END)
+                voice_listbox.insert(tk.END, "Loading voices...")
+                threading.Thread(target=load_voices, daemon=True).start()
         
         # Buttons
         btn_frame = tk.Frame(voice_win, bg="#2d2d30", pady=10)
@@ -1974,17 +2588,24 @@ class VisualEdgeReader:
                 self.voice = voice_name
                 self.db.set_setting("tts_voice", voice_name)
                 # Clear audio cache since voice changed
-                self.audio_cache.clear()
+                self.clear_audio_cache()
                 messagebox.showinfo("Voice Changed", f"Voice set to: {voice_name}")
-                voice_win.destroy()
+                voice_win.withdraw()
         
         ttk.Button(btn_frame, text="Apply", command=apply_voice).pack(side=tk.RIGHT, padx=20)
-        ttk.Button(btn_frame, text="Cancel", command=voice_win.destroy).pack(side=tk.RIGHT)
+        ttk.Button(btn_frame, text="Cancel", command=voice_win.withdraw).pack(side=tk.RIGHT)
+        voice_win.protocol("WM_DELETE_WINDOW", voice_win.withdraw)
+        
+        return voice_win, refresh
     
     # --- App lifecycle ---
     def on_app_close(self):
         """Handle app close - save progress and cleanup"""
         self.save_current_progress()
+        self.render_pool.shutdown(wait=False, cancel_futures=True)
+        self.thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self.cache_pool.shutdown(wait=False, cancel_futures=True)
+        self.tts_loop.call_soon_threadsafe(self.tts_loop.stop)
         self.db.close()
         pygame.mixer.quit()
         self.root.destroy()